@@ -47,6 +47,7 @@ def create_database() -> bool:
             _create_debits_table(cursor)
             _create_activity_log_table(cursor)
             _create_product_losses_table(cursor)
+            _create_losses_table(cursor)
             _create_customers_table(cursor)
             _create_quotes_table(cursor)
             _create_payments_table(cursor)
@@ -188,6 +189,20 @@ def _create_product_losses_table(cursor):
     """)
     logger.info("Created ProductLosses table")
 
+def _create_losses_table(cursor):
+    """Create Losses table for stock write-offs recorded from the inventory page"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS Losses (
+            LossID INTEGER PRIMARY KEY AUTOINCREMENT,
+            ProductID INTEGER NOT NULL,
+            Quantity INTEGER NOT NULL,
+            Reason TEXT,
+            DateTime TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
+        )
+    """)
+    logger.info("Created Losses table")
+
 def _create_customers_table(cursor):
     """Create Customers table for customer management"""
     cursor.execute("""
@@ -364,7 +379,7 @@ def check_database_integrity() -> bool:
             # Check table existence
             required_tables = [
                 'Users', 'Products', 'Invoices', 'InvoiceItems', 'Debits',
-                'ActivityLog', 'ProductLosses', 'Customers', 'Quotes', 'Payments', 'Categories'
+                'ActivityLog', 'ProductLosses', 'Losses', 'Customers', 'Quotes', 'Payments', 'Categories'
             ]
             
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -517,7 +517,7 @@ class EnhancedDataAccess:
             on_error
         )
     
-    def add_debit(self, debit_data: dict, on_success: Callable, on_error: Callable = None):
+    def add_debit(self, debit_data: dict, on_success: Callable, on_error: Callable = None) -> bool:
         """
         Add a new debit in background
         
@@ -525,6 +525,9 @@ class EnhancedDataAccess:
             debit_data: Dictionary with debit information
             on_success: Callback for successful completion
             on_error: Callback for error handling
+            
+        Returns:
+            bool: True if the task started, False if an add is already running
         """
         def add_debit_impl():
             try:
@@ -555,14 +558,14 @@ class EnhancedDataAccess:
             except Exception as e:
                 return {'success': False, 'error': str(e)}
         
-        self.run_in_background(
+        return self.run_in_background(
             "add_debit",
             add_debit_impl,
             on_success,
             on_error
         )
     
-    def update_debit(self, debit_data: dict, on_success: Callable, on_error: Callable = None):
+    def update_debit(self, debit_data: dict, on_success: Callable, on_error: Callable = None) -> bool:
         """
         Update an existing debit in background
         
@@ -570,6 +573,9 @@ class EnhancedDataAccess:
             debit_data: Dictionary with debit information
             on_success: Callback for successful completion
             on_error: Callback for error handling
+            
+        Returns:
+            bool: True if the task started, False if an update is already running
         """
         def update_debit_impl():
             try:
@@ -594,18 +600,28 @@ class EnhancedDataAccess:
                         raise ValueError(f"Debit with ID {debit_id} not found")
                     
                     conn.commit()
-                    return {'success': True}
+                    return {
+                        'success': True,
+                        'row': {
+                            'CustomerName': customer_name,
+                            'Name': customer_name,
+                            'Amount': amount,
+                            'Status': status,
+                            'Paid': paid,
+                            'Notes': notes
+                        }
+                    }
             except Exception as e:
                 return {'success': False, 'error': str(e)}
         
-        self.run_in_background(
+        return self.run_in_background(
             "update_debit",
             update_debit_impl,
             on_success,
             on_error
         )
     
-    def delete_debit(self, debit_id: int, on_success: Callable, on_error: Callable = None):
+    def delete_debit(self, debit_id: int, on_success: Callable, on_error: Callable = None) -> bool:
         """
         Delete a debit in background
         
@@ -613,6 +629,9 @@ class EnhancedDataAccess:
             debit_id: ID of the debit to delete
             on_success: Callback for successful completion
             on_error: Callback for error handling
+            
+        Returns:
+            bool: True if the task started, False if a delete is already running
         """
         def delete_debit_impl():
             try:
@@ -635,14 +654,14 @@ class EnhancedDataAccess:
             except Exception as e:
                 return {'success': False, 'error': str(e)}
         
-        self.run_in_background(
+        return self.run_in_background(
             "delete_debit",
             delete_debit_impl,
             on_success,
             on_error
         )
     
-    def mark_debit_as_paid(self, debit_id: int, on_success: Callable, on_error: Callable = None):
+    def mark_debit_as_paid(self, debit_id: int, on_success: Callable, on_error: Callable = None) -> bool:
         """
         Mark a debit as paid in background
         
@@ -650,6 +669,9 @@ class EnhancedDataAccess:
             debit_id: ID of the debit to mark as paid
             on_success: Callback for successful completion
             on_error: Callback for error handling
+            
+        Returns:
+            bool: True if the task started, False if one is already running
         """
         def mark_paid_impl():
             try:
@@ -673,11 +695,14 @@ class EnhancedDataAccess:
                     """, (debit_id,))
                     
                     conn.commit()
-                    return {'success': True}
+                    return {
+                        'success': True,
+                        'row': {'AmountPaid': amount, 'Status': 'Paid', 'Paid': True}
+                    }
             except Exception as e:
                 return {'success': False, 'error': str(e)}
         
-        self.run_in_background(
+        return self.run_in_background(
             "mark_debit_as_paid",
             mark_paid_impl,
             on_success,
@@ -854,6 +879,41 @@ class EnhancedDataAccess:
                 'average_sale': 0
             }
 
+    def get_inventory_stats(self, low_stock_threshold: int = 5) -> Optional[Dict]:
+        """
+        Get inventory statistics computed in a single aggregate query
+        
+        Args:
+            low_stock_threshold: Highest stock level counted as low stock
+            
+        Returns:
+            Dictionary with product, category and stock statistics, or None
+            if the query failed
+        """
+        try:
+            with ConnectionContext() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(*),
+                           COUNT(DISTINCT Category),
+                           COALESCE(SUM(SellingPrice * Stock), 0),
+                           COALESCE(SUM(Stock > 0 AND Stock <= ?), 0),
+                           COALESCE(SUM(Stock <= 0), 0)
+                    FROM Products
+                """, (low_stock_threshold,))
+                
+                row = cursor.fetchone()
+                return {
+                    'total_products': row[0],
+                    'total_categories': row[1],
+                    'total_value': float(row[2]),
+                    'low_stock': row[3],
+                    'out_of_stock': row[4]
+                }
+        except Exception as e:
+            log_db_operation(f'SELECT Inventory Stats Error: {str(e)}')
+            return None
+
     def get_top_products(self, limit: int = 10) -> List[Dict]:
         """
         Get top selling products
@@ -1044,8 +1104,8 @@ class EnhancedDataAccess:
             log_db_operation(f'UPDATE Products Error: {str(e)}')
             return False
     
-    def add_product(self, product_data: dict) -> bool:
-        """Add a new product"""
+    def add_product(self, product_data: dict) -> Union[int, bool]:
+        """Add a new product and return its ID, or False on failure"""
         try:
             with ConnectionContext() as conn:
                 cursor = conn.cursor()
@@ -1061,11 +1121,51 @@ class EnhancedDataAccess:
                     product_data.get('Barcode', product_data.get('barcode', ''))
                 ))
                 conn.commit()
-                return True
+                return cursor.lastrowid
         except Exception as e:
             log_db_operation(f'INSERT Products Error: {str(e)}')
             return False
     
+    def update_product_prices(self, prices: Dict[int, float]) -> bool:
+        """Set the selling price of several products in a single transaction"""
+        try:
+            with ConnectionContext() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "UPDATE Products SET SellingPrice = ? WHERE ProductID = ?",
+                    [(price, product_id) for product_id, price in prices.items()]
+                )
+                conn.commit()
+                return True
+        except Exception as e:
+            log_db_operation(f'UPDATE Products Prices Error: {str(e)}')
+            return False
+    
+    def record_loss(self, loss_data: dict) -> bool:
+        """Record a product loss and take it off the product's stock"""
+        try:
+            with ConnectionContext() as conn:
+                cursor = conn.cursor()
+                reason = loss_data.get('reason', '')
+                notes = loss_data.get('notes', '')
+                cursor.execute("""
+                    INSERT INTO Losses (ProductID, Quantity, Reason, DateTime)
+                    VALUES (?, ?, ?, ?)
+                """, (
+                    loss_data['product_id'],
+                    loss_data['quantity_lost'],
+                    f"{reason} - {notes}" if notes else reason,
+                    time.strftime("%Y-%m-%d %H:%M:%S")
+                ))
+                # A loss larger than the stock empties it rather than going negative
+                cursor.execute("UPDATE Products SET Stock = MAX(Stock - ?, 0) WHERE ProductID = ?",
+                               (loss_data['quantity_lost'], loss_data['product_id']))
+                conn.commit()
+                return True
+        except Exception as e:
+            log_db_operation(f'INSERT Losses Error: {str(e)}')
+            return False
+    
     def update_product_stock(self, product_id: int, new_stock: int) -> bool:
         """Update product stock quantity"""
         try:
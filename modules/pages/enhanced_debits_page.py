@@ -15,6 +15,7 @@ from tkinter import (
     HORIZONTAL, BOTTOM, messagebox, StringVar, BooleanVar,
     IntVar, DoubleVar
 )
+from tkinter import font as tkfont
 import datetime
 import logging
 from decimal import Decimal
@@ -32,6 +33,20 @@ from modules.i18n import _, register_refresh_callback, unregister_refresh_callba
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Message boxes used by the _info/_warn/_err helpers
+_showinfo = messagebox.showinfo
+_showwarning = messagebox.showwarning
+_showerror = messagebox.showerror
+
+# Operations finishing faster than this never show a progress dialog
+PROGRESS_DELAY_MS = 150
+
+# Background debit operations, resolved once at import
+_db_add_debit = enhanced_data.add_debit
+_db_update_debit = enhanced_data.update_debit
+_db_delete_debit = enhanced_data.delete_debit
+_db_mark_debit_paid = enhanced_data.mark_debit_as_paid
+
 class EnhancedDebitsPage(ttk.Frame):
     """
     Enhanced debits page with optimized performance.
@@ -46,6 +61,26 @@ class EnhancedDebitsPage(ttk.Frame):
         # Store active background tasks
         self._active_tasks = {}
         
+        # Pending coalesced refresh flag (see _request_refresh)
+        self._refresh_pending = False
+        
+        # Currently selected debit (raw row dict) or None
+        self.selected_debit = None
+        
+        # Tree item IDs of the displayed debits, keyed by DebitID
+        self._iid_by_debit_id = {}
+        
+        # Reusable add/edit dialog (see _build_debit_dialog)
+        self._debit_dialog = None
+        self._dlg_vars = None
+        self._dlg_debit_id = None
+        
+        # Cache translated message templates
+        self._cache_translations()
+        
+        # Shared styles for the add/edit dialog
+        self._setup_dialog_styles()
+        
         # Create text variables
         self._create_variables()
           # Create UI components
@@ -89,6 +124,58 @@ class EnhancedDebitsPage(ttk.Frame):
         self.delete_debit_var = StringVar(value=_("Delete"))
         self.refresh_var = StringVar(value=_("Refresh"))
         
+    def _cache_translations(self):
+        """Translate frequently used message templates once per language"""
+        self._T = {
+            # Dialog titles
+            "error": _("Error"),
+            "warning": _("Warning"),
+            "success": _("Success"),
+            "info": _("Info"),
+            # Messages
+            "mark_paid": _("Mark this debit as paid?\nAmount: $%.2f"),
+            "err_no_sel_edit": _("Please select a debit to edit."),
+            "err_no_sel_delete": _("Please select a debit to delete."),
+            "err_no_sel_paid": _("Please select a debit to mark as paid."),
+            "already_paid": _("This debit is already marked as paid."),
+            "err_customer": _("Please enter a customer name"),
+            "err_amount": _("Please enter a valid amount"),
+            "unknown_error": _("Unknown error"),
+            "saved": _("Debit saved successfully"),
+            "save_failed": _("Failed to save debit: {0}"),
+            "deleted": _("Debit deleted successfully."),
+            "delete_failed": _("Failed to delete debit: {0}"),
+            "marked_paid": _("Debit marked as paid successfully."),
+            "mark_paid_failed": _("Failed to mark debit as paid: {0}"),
+            "busy": _("The previous request is still running. Please try again."),
+        }
+    
+    def _message(self, show, title_key, key, *args):
+        """Show a cached, translated message; args are formatted into it"""
+        text = self._T[key]
+        show(self._T[title_key], text.format(*args) if args else text)
+    
+    def _info(self, key, *args, title_key="success"):
+        """Show an information message from the translation cache"""
+        self._message(_showinfo, title_key, key, *args)
+    
+    def _warn(self, key, *args):
+        """Show a warning message from the translation cache"""
+        self._message(_showwarning, "warning", key, *args)
+    
+    def _err(self, key, *args):
+        """Show an error message from the translation cache"""
+        self._message(_showerror, "error", key, *args)
+        
+    def _setup_dialog_styles(self):
+        """Configure the add/edit dialog styles and font once per page"""
+        style = ttk.Style()
+        style.configure("Debit.TLabel", font=("Arial", 12))
+        
+        # ttk entries take their font as a widget option, so share one
+        # named font object instead of resolving a tuple per widget
+        self._dialog_font = tkfont.Font(root=self, family="Arial", size=12)
+        
     def _create_ui(self):
         """Create the main UI components with modern 2025 design"""
         # Main container with modern styling
@@ -522,11 +609,57 @@ class EnhancedDebitsPage(ttk.Frame):
         self._load_debits()
         self._load_statistics()
     
+    def _request_refresh(self):
+        """Schedule a single refresh on idle, coalescing repeated requests"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a refresh scheduled by _request_refresh"""
+        self._refresh_pending = False
+        self.refresh()
+    
+    def _start_progress(self, parent):
+        """Schedule a progress dialog that only appears for slow operations.
+        
+        Returns a handle for this operation's dialog; pass it to
+        _stop_progress so overlapping operations don't close each other's.
+        """
+        handle = {'parent': parent, 'dialog': None}
+        handle['job'] = self.after(PROGRESS_DELAY_MS, self._show_progress, handle)
+        return handle
+    
+    def _show_progress(self, handle):
+        """Show the deferred progress dialog of one operation"""
+        handle['job'] = None
+        handle['dialog'] = ProgressDialog(
+            handle['parent'],
+            title=_("Processing")
+        )
+    
+    def _stop_progress(self, handle):
+        """Cancel an operation's pending progress dialog or close the visible one"""
+        if handle['job'] is not None:
+            self.after_cancel(handle['job'])
+            handle['job'] = None
+        if handle['dialog'] is not None:
+            handle['dialog'].close()
+            handle['dialog'] = None
+    
     def _refresh_language(self):
         """Update all text elements with current language"""
         # Update UI direction
         set_widget_direction(self)
         
+        # Re-translate cached message templates
+        self._cache_translations()
+        
+        # Rebuild the pooled dialog with the new language on next use
+        if self._debit_dialog is not None:
+            self._debit_dialog.destroy()
+            self._debit_dialog = None
+        
         # Update all text variables with translated strings
         self.title_var.set(_("Manage Debits"))
         self.back_btn_var.set(_("Back to Home"))
@@ -572,21 +705,7 @@ class EnhancedDebitsPage(ttk.Frame):
         def on_debits_loaded(result):
             if isinstance(result, PagedResult):
                 # Transform data for display
-                data = []
-                for item in result.data:  # Use .data instead of .items
-                    # Format the paid status
-                    paid_status = _("Paid") if item.get("Paid") else _("Unpaid")
-                    
-                    data.append({
-                        "id": item["DebitID"],
-                        "customer": item["CustomerName"],
-                        "amount": f"${float(item['Amount']):.2f}",
-                        "date": item["Date"],
-                        "paid": paid_status,
-                        "notes": item.get("Notes", ""),
-                        # Store original data
-                        "raw_data": item
-                    })
+                data = [self._format_debit_row(item) for item in result.data]
                 
                 # Calculate total_pages from total_count and page_size
                 total_pages = max(1, (result.total_count + result.page_size - 1) // result.page_size)
@@ -598,6 +717,12 @@ class EnhancedDebitsPage(ttk.Frame):
                     result.current_page,  # Use .current_page instead of .page
                     total_pages  # Calculate total_pages
                 )
+                
+                # Index tree rows by debit ID for in-place updates
+                self._iid_by_debit_id = {
+                    row["id"]: iid
+                    for iid, row in zip(self.debits_list.tree.get_children(), data)
+                }
             
             # Close progress dialog
             progress.close()
@@ -626,6 +751,53 @@ class EnhancedDebitsPage(ttk.Frame):
             )
         )
     
+    def _format_debit_row(self, item):
+        """Build the list view row for a raw debit dict"""
+        # Format the paid status
+        paid_status = _("Paid") if item.get("Paid") else _("Unpaid")
+        
+        return {
+            "id": item["DebitID"],
+            "customer": item["CustomerName"],
+            "amount": f"${float(item['Amount']):.2f}",
+            "date": item["Date"],
+            "status": paid_status,
+            "notes": item.get("Notes", ""),
+            # Store original data
+            "raw_data": item
+        }
+    
+    def _patch_row(self, debit_id, changes):
+        """
+        Apply changed fields to a displayed debit without reloading the list.
+        
+        Returns:
+            bool: True if the row was updated, False if a full refresh is needed
+        """
+        iid = self._iid_by_debit_id.get(debit_id)
+        if iid is None or self.filter_var.get() != "all":
+            # Not on this page, or the change may move it out of the filter
+            return False
+        
+        for row in self.debits_list.current_data:
+            if row["id"] == debit_id:
+                row["raw_data"].update(changes)
+                row.update(self._format_debit_row(row["raw_data"]))
+                self.debits_list.tree.item(
+                    iid,
+                    values=[row.get(col, '') for col in self.debits_list.columns]
+                )
+                return True
+        return False
+    
+    def _apply_debit_result(self, debit_id, result):
+        """Patch the updated row in place, falling back to a full refresh"""
+        if not result.get("reload", False) and self._patch_row(debit_id, result.get("row") or {}):
+            # Totals still change, but they come from a single aggregate query
+            self._load_statistics()
+        else:
+            self._request_refresh()
+    
     def _load_statistics(self):
         """Load debit statistics (totals, unpaid amounts)"""
         # Get statistics in background
@@ -721,117 +893,51 @@ class EnhancedDebitsPage(ttk.Frame):
     
     def _edit_debit(self):
         """Show dialog to edit the selected debit"""
-        if not hasattr(self, "selected_debit") or not self.selected_debit:
+        if not self.selected_debit:
             return
         
         self._show_debit_dialog(self.selected_debit)
     
-    def _mark_as_paid(self):
-        """Mark the selected debit as paid"""
-        if not hasattr(self, "selected_debit") or not self.selected_debit:
-            return
+    def _show_debit_dialog(self, debit_data=None):
+        """Show dialog to add or edit a debit"""
+        # The dialog is built once and reused between openings
+        if self._debit_dialog is None or not self._debit_dialog.winfo_exists():
+            self._build_debit_dialog()
         
-        if messagebox.askyesno(
-            _("Confirm"),
-            _("Mark this debit as paid?")
-        ):            # Show progress dialog
-            progress = ProgressDialog(
-                self,
-                title=_("Processing")
-            )
-            
-            # Update in background
-            debit_id = self.selected_debit["DebitID"]
-            
-            def on_complete(result):
-                progress.close()
-                if result and result.get("success"):
-                    messagebox.showinfo(
-                        _("Success"),
-                        _("Debit marked as paid")
-                    )
-                    # Refresh data
-                    self.refresh()
-                else:
-                    messagebox.showerror(
-                        _("Error"),
-                        _("Failed to update debit: {0}").format(
-                            result.get("error", _("Unknown error"))
-                        )
-                    )
-            
-            def on_error(error):
-                progress.close()
-                messagebox.showerror(
-                    _("Error"),
-                    _("Failed to update debit: {0}").format(str(error))
-                )
-            
-            # Call update function
-            enhanced_data.mark_debit_as_paid(
-                debit_id,
-                on_success=on_complete,
-                on_error=on_error
-            )
-    
-    def _delete_debit(self):
-        """Delete the selected debit"""
-        if not hasattr(self, "selected_debit") or not self.selected_debit:
-            return
+        dialog, customer_var, amount_var, date_var, paid_var, notes_entry = self._dlg_vars
+        dialog.title(_("Add Debit") if not debit_data else _("Edit Debit"))
+        self._dlg_debit_id = debit_data.get("DebitID") if debit_data else None
         
-        if messagebox.askyesno(
-            _("Confirm Delete"),
-            _("Are you sure you want to delete this debit?"),
-            icon="warning"
-        ):            # Show progress dialog
-            progress = ProgressDialog(
-                self,
-                title=_("Processing")
-            )
-            
-            # Delete in background
-            debit_id = self.selected_debit["DebitID"]
-            
-            def on_complete(result):
-                progress.close()
-                if result and result.get("success"):
-                    messagebox.showinfo(
-                        _("Success"),
-                        _("Debit deleted successfully")
-                    )
-                    # Refresh data
-                    self.refresh()
-                else:
-                    messagebox.showerror(
-                        _("Error"),
-                        _("Failed to delete debit: {0}").format(
-                            result.get("error", _("Unknown error"))
-                        )
-                    )
-            
-            def on_error(error):
-                progress.close()
-                messagebox.showerror(
-                    _("Error"),
-                    _("Failed to delete debit: {0}").format(str(error))
-                )
-            
-            # Call delete function
-            enhanced_data.delete_debit(
-                debit_id,
-                on_success=on_complete,
-                on_error=on_error
-            )
+        # Reset the fields for this debit
+        customer_var.set(debit_data.get("CustomerName", "") if debit_data else "")
+        amount_var.set(str(debit_data.get("Amount", "")) if debit_data else "")
+        
+        if debit_data and debit_data.get("Date"):
+            date_var.set(debit_data.get("Date"))
+        else:
+            # Set current date as default
+            date_var.set(datetime.datetime.now().strftime("%Y-%m-%d"))
+        
+        paid_var.set(debit_data.get("Paid", False) if debit_data else False)
+        
+        notes_entry.delete("1.0", "end")
+        if debit_data and debit_data.get("Notes"):
+            notes_entry.insert("1.0", debit_data["Notes"])
+        
+        dialog.deiconify()
+        dialog.grab_set()
+        
+        # Focus on first field
+        self._dlg_customer_entry.focus_set()
     
-    def _show_debit_dialog(self, debit_data=None):
-        """Show dialog to add or edit a debit"""
-        # Create dialog window
+    def _build_debit_dialog(self):
+        """Create the add/edit debit dialog widgets (hidden)"""
         dialog = ttk.Toplevel(self)
-        dialog.title(_("Add Debit") if not debit_data else _("Edit Debit"))
+        dialog.withdraw()
         dialog.geometry("500x400")
         dialog.resizable(False, False)
         dialog.transient(self)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_debit_dialog)
         
         # Form frame
         form_frame = ttk.Frame(dialog, padding=20)
@@ -841,18 +947,15 @@ class EnhancedDebitsPage(ttk.Frame):
         ttk.Label(
             form_frame,
             text=_("Customer Name:"),
-            font=("Arial", 12)
+            style="Debit.TLabel"
         ).grid(row=0, column=0, sticky=W, pady=5)
         
         customer_var = StringVar()
-        if debit_data:
-            customer_var.set(debit_data.get("CustomerName", ""))
-        
         customer_entry = ttk.Entry(
             form_frame,
             textvariable=customer_var,
             width=30,
-            font=("Arial", 12)
+            font=self._dialog_font
         )
         customer_entry.grid(row=0, column=1, sticky=W, pady=5)
         
@@ -860,18 +963,15 @@ class EnhancedDebitsPage(ttk.Frame):
         ttk.Label(
             form_frame,
             text=_("Amount:"),
-            font=("Arial", 12)
+            style="Debit.TLabel"
         ).grid(row=1, column=0, sticky=W, pady=5)
         
         amount_var = StringVar()
-        if debit_data:
-            amount_var.set(str(debit_data.get("Amount", "")))
-        
         amount_entry = ttk.Entry(
             form_frame,
             textvariable=amount_var,
             width=15,
-            font=("Arial", 12)
+            font=self._dialog_font
         )
         amount_entry.grid(row=1, column=1, sticky=W, pady=5)
         
@@ -879,32 +979,20 @@ class EnhancedDebitsPage(ttk.Frame):
         ttk.Label(
             form_frame,
             text=_("Date:"),
-            font=("Arial", 12)
+            style="Debit.TLabel"
         ).grid(row=2, column=0, sticky=W, pady=5)
         
         date_var = StringVar()
-        if debit_data and debit_data.get("Date"):
-            date_var.set(debit_data.get("Date"))
-        else:
-            # Set current date as default
-            current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-            date_var.set(current_date)
-        
         date_entry = ttk.Entry(
             form_frame,
             textvariable=date_var,
             width=15,
-            font=("Arial", 12)
+            font=self._dialog_font
         )
         date_entry.grid(row=2, column=1, sticky=W, pady=5)
         
         # Paid status
-        paid_var = BooleanVar()
-        if debit_data:
-            paid_var.set(debit_data.get("Paid", False))
-        else:
-            paid_var.set(False)
-        
+        paid_var = BooleanVar(value=False)
         paid_check = ttk.Checkbutton(
             form_frame,
             text=_("Paid"),
@@ -917,50 +1005,48 @@ class EnhancedDebitsPage(ttk.Frame):
         ttk.Label(
             form_frame,
             text=_("Notes:"),
-            font=("Arial", 12)
+            style="Debit.TLabel"
         ).grid(row=4, column=0, sticky=W, pady=5)
         
-        notes_var = StringVar()
-        if debit_data:
-            notes_var.set(debit_data.get("Notes", ""))
-        
         notes_entry = ttk.Text(
             form_frame,
             width=40,
             height=5,
-            font=("Arial", 12)
+            font=self._dialog_font
         )
-        if debit_data and debit_data.get("Notes"):
-            notes_entry.insert("1.0", debit_data.get("Notes"))
         notes_entry.grid(row=5, column=0, columnspan=2, sticky="nsew", pady=5)
         
         # Button frame
         button_frame = ttk.Frame(form_frame)
         button_frame.grid(row=6, column=0, columnspan=2, pady=15)
         
+        # Keep references for reuse and the Save handler
+        self._debit_dialog = dialog
+        self._dlg_customer_entry = customer_entry
+        self._dlg_vars = (
+            dialog,
+            customer_var,
+            amount_var,
+            date_var,
+            paid_var,
+            notes_entry
+        )
+        
         # Save button
         save_button = ttk.Button(
             button_frame,
             text=_("Save"),
-            command=lambda: self._save_debit(
-                dialog,
-                debit_data.get("DebitID") if debit_data else None,
-                customer_var.get(),
-                amount_var.get(),
-                date_var.get(),
-                paid_var.get(),
-                notes_entry.get("1.0", "end-1c")
-            ),
             bootstyle=SUCCESS,
             width=15
         )
+        save_button.configure(command=self._on_save_clicked)
         save_button.pack(side=LEFT, padx=5)
         
         # Cancel button
         cancel_button = ttk.Button(
             button_frame,
             text=_("Cancel"),
-            command=dialog.destroy,
+            command=self._hide_debit_dialog,
             bootstyle=SECONDARY,
             width=15
         )
@@ -969,35 +1055,47 @@ class EnhancedDebitsPage(ttk.Frame):
         # Make form expandable
         form_frame.columnconfigure(1, weight=1)
         form_frame.rowconfigure(5, weight=1)
-          # Focus on first field
-        customer_entry.focus_set()
+    
+    def _hide_debit_dialog(self):
+        """Hide the add/edit debit dialog so it can be reused"""
+        if self._debit_dialog is not None and self._debit_dialog.winfo_exists():
+            self._debit_dialog.grab_release()
+            self._debit_dialog.withdraw()
+    
+    def _on_save_clicked(self):
+        """Collect the debit dialog fields and save them"""
+        dialog, customer_var, amount_var, date_var, paid_var, notes_entry = self._dlg_vars
+        self._save_debit(
+            dialog,
+            self._dlg_debit_id,
+            customer_var.get(),
+            amount_var.get(),
+            date_var.get(),
+            paid_var.get(),
+            notes_entry.get("1.0", "end-1c")
+        )
     
     def _save_debit(self, dialog, debit_id, customer_name, amount_str, date_str, paid, notes):
         """Save the debit data"""
         # Validate input
         if not customer_name:
-            messagebox.showerror(
-                _("Error"),
-                _("Please enter a customer name")
-            )
+            self._err("err_customer")
             return
         
-        try:
-            amount = float(amount_str)
-            if amount <= 0:
-                raise ValueError()
-        except:
-            messagebox.showerror(
-                _("Error"),
-                _("Please enter a valid amount")
-            )
+        amount_str = amount_str.strip() if amount_str else ""
+        amount = None
+        if amount_str:
+            try:
+                amount = float(amount_str)
+            except ValueError:
+                amount = None
+
+        if amount is None or amount <= 0:
+            self._err("err_amount")
             return
         
-        # Show progress dialog
-        progress = ProgressDialog(
-            dialog,
-            title=_("Processing")
-        )
+        # Show progress dialog if the save takes a while
+        progress = self._start_progress(dialog)
         
         # Prepare data
         debit_data = {
@@ -1012,45 +1110,32 @@ class EnhancedDebitsPage(ttk.Frame):
             debit_data["DebitID"] = debit_id
         
         def on_complete(result):
-            progress.close()
+            self._stop_progress(progress)
             if result and result.get("success"):
-                dialog.destroy()
-                messagebox.showinfo(
-                    _("Success"),
-                    _("Debit saved successfully")
-                )
-                # Refresh data
-                self.refresh()
+                self._hide_debit_dialog()
+                self._info("saved")
+                if debit_id:
+                    self._apply_debit_result(debit_id, result)
+                else:
+                    # New debits change paging and totals
+                    self._request_refresh()
             else:
-                messagebox.showerror(
-                    _("Error"),
-                    _("Failed to save debit: {0}").format(
-                        result.get("error", _("Unknown error"))
-                    )
-                )
+                self._err("save_failed", result.get("error", self._T["unknown_error"]))
         
         def on_error(error):
-            progress.close()
-            messagebox.showerror(
-                _("Error"),
-                _("Failed to save debit: {0}").format(str(error))
-            )
-        
-        # Save data in background
-        if debit_id:
-            # Update existing debit
-            enhanced_data.update_debit(
-                debit_data,
-                on_success=on_complete,
-                on_error=on_error
-            )
-        else:
-            # Add new debit
-            enhanced_data.add_debit(
-                debit_data,
-                on_success=on_complete,
-                on_error=on_error
-            )
+            self._stop_progress(progress)
+            self._err("save_failed", str(error))
+        
+        # Save data in background (update existing debit or add a new one);
+        # the callbacks run on the worker thread, so hand them to the Tk loop
+        save = _db_update_debit if debit_id else _db_add_debit
+        if not save(
+            debit_data,
+            on_success=lambda r: self.after(0, on_complete, r),
+            on_error=lambda e: self.after(0, on_error, e)
+        ):
+            self._stop_progress(progress)
+            self._err("save_failed", self._T["busy"])
     
     # ===== MODERN ACTION METHODS =====
     
@@ -1062,7 +1147,7 @@ class EnhancedDebitsPage(ttk.Frame):
     def _filter_by_date(self, days):
         """Filter debits by date range"""
         # TODO: Implement date filtering
-        messagebox.showinfo(_("Date Filter"), _(f"Filtering by last {days} days"))
+        messagebox.showinfo(_("Date Filter"), _("Filtering by last {0} days").format(days))
     
     def _filter_current_month(self):
         """Filter debits for current month"""
@@ -1091,12 +1176,12 @@ class EnhancedDebitsPage(ttk.Frame):
         dialog = DebitDialog(self, title=_("Add New Debit"))
         if dialog.result:
             # Refresh the list after adding
-            self.refresh()
+            self._request_refresh()
     
     def _edit_selected_debit(self):
         """Edit the selected debit"""
-        if not hasattr(self, 'selected_debit') or not self.selected_debit:
-            messagebox.showwarning(_("Warning"), _("Please select a debit to edit."))
+        if not self.selected_debit:
+            self._warn("err_no_sel_edit")
             return
         
         from modules.debits import DebitDialog
@@ -1108,51 +1193,84 @@ class EnhancedDebitsPage(ttk.Frame):
         )
         if dialog.result:
             # Refresh the list after editing
-            self.refresh()
+            self._request_refresh()
     
     def _delete_selected_debit(self):
         """Delete the selected debit"""
-        if not hasattr(self, 'selected_debit') or not self.selected_debit:
-            messagebox.showwarning(_("Warning"), _("Please select a debit to delete."))
+        if not self.selected_debit:
+            self._warn("err_no_sel_delete")
             return
         
         if messagebox.askyesno(
             _("Confirm Delete"),
             _("Are you sure you want to delete this debit?\nThis action cannot be undone.")
         ):
-            try:
-                # Delete the debit
-                enhanced_data.delete_debit(self.selected_debit["DebitID"])
-                messagebox.showinfo(_("Success"), _("Debit deleted successfully."))
-                self.refresh()
-            except Exception as e:
-                logger.error(f"Error deleting debit: {str(e)}")
-                messagebox.showerror(_("Error"), _("Failed to delete debit: {0}").format(str(e)))
+            # Show progress dialog if the update takes a while
+            progress = self._start_progress(self)
+            
+            def on_complete(result):
+                self._stop_progress(progress)
+                if result and result.get("success"):
+                    self._info("deleted")
+                    # Refresh data
+                    self._request_refresh()
+                else:
+                    self._err("delete_failed", result.get("error", self._T["unknown_error"]))
+            
+            def on_error(error):
+                self._stop_progress(progress)
+                logger.error(f"Error deleting debit: {str(error)}")
+                self._err("delete_failed", str(error))
+            
+            # Delete in background; the callbacks run on the worker thread,
+            # so hand them to the Tk loop
+            if not _db_delete_debit(
+                self.selected_debit["DebitID"],
+                on_success=lambda r: self.after(0, on_complete, r),
+                on_error=lambda e: self.after(0, on_error, e)
+            ):
+                self._stop_progress(progress)
+                self._err("delete_failed", self._T["busy"])
     
     def _mark_as_paid(self):
         """Mark selected debit as paid"""
-        if not hasattr(self, 'selected_debit') or not self.selected_debit:
-            messagebox.showwarning(_("Warning"), _("Please select a debit to mark as paid."))
+        if not self.selected_debit:
+            self._warn("err_no_sel_paid")
             return
         
         if self.selected_debit.get("Paid"):
-            messagebox.showinfo(_("Info"), _("This debit is already marked as paid."))
+            self._info("already_paid", title_key="info")
             return
         
         if messagebox.askyesno(
             _("Mark as Paid"),
-            _("Mark this debit as paid?\nAmount: ${0:.2f}").format(
-                float(self.selected_debit.get("Amount", 0))
-            )
+            self._T["mark_paid"] % float(self.selected_debit.get("Amount", 0))
         ):
-            try:
-                # Mark as paid
-                enhanced_data.mark_debit_paid(self.selected_debit["DebitID"])
-                messagebox.showinfo(_("Success"), _("Debit marked as paid successfully."))
-                self.refresh()
-            except Exception as e:
-                logger.error(f"Error marking debit as paid: {str(e)}")
-                messagebox.showerror(_("Error"), _("Failed to mark debit as paid: {0}").format(str(e)))
+            # Show progress dialog if the update takes a while
+            progress = self._start_progress(self)
+            
+            def on_complete(result):
+                self._stop_progress(progress)
+                if result and result.get("success"):
+                    self._info("marked_paid")
+                    self._apply_debit_result(debit_id, result)
+                else:
+                    self._err("mark_paid_failed", result.get("error", self._T["unknown_error"]))
+            
+            def on_error(error):
+                self._stop_progress(progress)
+                logger.error(f"Error marking debit as paid: {str(error)}")
+                self._err("mark_paid_failed", str(error))
+            
+            # Update in background
+            debit_id = self.selected_debit["DebitID"]
+            if not _db_mark_debit_paid(
+                debit_id,
+                on_success=lambda r: self.after(0, on_complete, r),
+                on_error=lambda e: self.after(0, on_error, e)
+            ):
+                self._stop_progress(progress)
+                self._err("mark_paid_failed", self._T["busy"])
     
     def _send_reminders(self):
         """Send payment reminders to customers"""
@@ -19,12 +19,19 @@ from tkinter import (
     HORIZONTAL, VERTICAL, messagebox, StringVar, BooleanVar, 
     IntVar, DoubleVar, Toplevel, Frame as TkFrame
 )
+from tkinter import font as tkfont
 import datetime
 import logging
+import os
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import zip_longest
+from operator import itemgetter, mul
 
 # Import from our enhanced modules
 from modules.enhanced_data_access import enhanced_data, PagedResult
-from modules.ui_components import ProgressDialog, PaginatedListView, FastSearchEntry
 from modules.db_manager import ConnectionContext
 from modules.data_access import invalidate_cache
 
@@ -34,9 +41,128 @@ from modules.i18n import _, tr, register_refresh_callback, unregister_refresh_ca
 # Configure logger
 logger = logging.getLogger(__name__)
 
-class ProductDialog:
+# Delay before a search or impact preview runs after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
+IMPACT_DEBOUNCE_MS = 100
+REFRESH_DEBOUNCE_MS = 150
+TOAST_MS = 3000
+
+# Fixed products table row height; the virtual window is sized from it
+TREE_ROW_HEIGHT = 28
+
+# Rows attached to the products table until its real height is known
+TREE_DEFAULT_VISIBLE_ROWS = 25
+
+# Row moves above this count are done with the table unmapped to skip redraws
+TREE_HIDE_THRESHOLD = 50
+
+# Long-lived workers for inventory loads: loads run one at a time, and the
+# categories query overlaps the products query on the second executor
+_LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inventory-load")
+_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inventory-query")
+# Product/category writes, one at a time so they reach the database in click order
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inventory-write")
+
+# Shared Segoe UI fonts, created on first use (a Tk root must exist by then)
+_FONTS = {}
+
+def F(size, style='normal'):
+    """Return the cached Segoe UI font for ``size`` and ``style`` (normal/bold/italic)"""
+    key = (size, style)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = tkfont.Font(
+            family="Segoe UI", size=size,
+            weight='bold' if style == 'bold' else 'normal',
+            slant='italic' if style == 'italic' else 'roman')
+    return font
+
+# Category icons shipped in assets/categories, drawn in place of emoji glyphs
+_CATEGORY_ICON_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets", "categories"))
+_CATEGORY_ICON_FILES = {
+    "Juice": "juice.png",
+    "Eggs": "eggs.png",
+    "Snacks": "snacks.png",
+    "Milk & Dairy": "milk_dairy.png",
+    "Ice Cream": "ice_cream.png",
+    "Staple Food": "staplefood.png",
+}
+_ICONS = {}
+
+def category_icon(name, size=16):
+    """Return a cached PhotoImage for a category, or None if it has no icon"""
+    key = (name, size)
+    if key not in _ICONS:
+        icon = None
+        filename = _CATEGORY_ICON_FILES.get(name)
+        if filename:
+            # PIL is only needed once a category with an icon is shown
+            from PIL import Image, ImageTk
+            path = os.path.join(_CATEGORY_ICON_DIR, filename)
+            try:
+                icon = ImageTk.PhotoImage(Image.open(path).resize((size, size), Image.Resampling.LANCZOS))
+            except OSError as e:
+                logger.warning("Could not load category icon %s: %s", path, e)
+        _ICONS[key] = icon
+    return _ICONS[key]
+
+# Bumped whenever products or categories change so cached lists reload
+_categories_version = 0
+
+@lru_cache(maxsize=4)
+def _cached_category_names(version):
+    """Category names for the product dialog, cached per categories version"""
+    return tuple(cat.get('name', str(cat)) for cat in enhanced_data.get_categories())
+
+def invalidate_categories_cache():
+    """Make the next product dialog reload its category list"""
+    global _categories_version
+    _categories_version += 1
+
+class _PooledDialogMixin:
+    """Keep one hidden Toplevel per dialog class and reuse it on the next open"""
+    
+    # Widgets of the pooled dialog plus its parent, shared by every instance
+    _instance = None
+    _POOLED_ATTRS = ()
+    
+    def _take_pooled(self):
+        """Adopt the pooled dialog widgets if they still belong to our parent"""
+        pooled = type(self)._instance
+        if not pooled or pooled['parent'] is not self.parent or not pooled['dialog'].winfo_exists():
+            return False
+        for name in self._POOLED_ATTRS:
+            setattr(self, name, pooled[name])
+        return True
+    
+    def _stash_pooled(self):
+        """Remember freshly built dialog widgets for later opens"""
+        pooled = {name: getattr(self, name) for name in self._POOLED_ATTRS}
+        pooled['parent'] = self.parent
+        type(self)._instance = pooled
+    
+    def _wait_hidden(self):
+        """Block until the dialog is withdrawn again"""
+        self._closed = tk.BooleanVar(self.dialog, False)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel)
+        self.dialog.grab_set()
+        self.dialog.wait_variable(self._closed)
+    
+    def _hide(self):
+        """Withdraw the dialog instead of destroying it"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._closed.set(True)
+
+class ProductDialog(_PooledDialogMixin):
     """Professional product add/edit dialog"""
     
+    _POOLED_ATTRS = ('dialog', 'title_label', 'name_entry', 'category_combo',
+                     'buy_price_entry', 'sell_price_entry', 'stock_entry',
+                     'barcode_entry', 'save_button', 'cancel_button',
+                     'name_var', 'category_var', 'buy_price_var', 'sell_price_var',
+                     'stock_var', 'barcode_var')
+    
     def __init__(self, parent, product_data=None):
         self.parent = parent
         self.product_data = product_data
@@ -45,11 +171,19 @@ class ProductDialog:
         
     def show(self):
         """Show the professional product dialog"""
-        self.dialog = Toplevel(self.parent)
+        if self._take_pooled():
+            self._reset_fields()
+            self.dialog.deiconify()
+        else:
+            self._build()
+            self._stash_pooled()
+        
+        # Texts and commands that depend on this open
         self.dialog.title("Add Product" if not self.product_data else "Edit Product")
-        self.dialog.geometry("500x600")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        self.title_label.config(text="Add New Product" if not self.product_data else "Edit Product Details")
+        self.save_button.config(text="Add Product" if not self.product_data else "Save Changes",
+                                command=self._save)
+        self.cancel_button.config(command=self._cancel)
         
         # Center the dialog
         self.dialog.geometry("+%d+%d" % (
@@ -57,30 +191,44 @@ class ProductDialog:
             self.parent.winfo_rooty() + 50
         ))
         
+        self._load_categories()
+        
+        # Populate fields if editing
+        if self.product_data:
+            self._populate_fields()
+        
+        # Focus on first field
+        self.name_entry.focus()
+        
+        # Wait for dialog result
+        self._wait_hidden()
+        return self.result
+    
+    def _build(self):
+        """Create the dialog window and its widgets"""
+        self.dialog = Toplevel(self.parent)
+        self.dialog.geometry("500x600")
+        self.dialog.transient(self.parent)
+        
         # Professional styling
         main_frame = ttk.Frame(self.dialog)
         main_frame.pack(fill=BOTH, expand=True, padx=20, pady=20)
         
         # Title
-        title = "Add New Product" if not self.product_data else "Edit Product Details"
-        ttk.Label(main_frame, text=title, font=("Segoe UI", 16, "bold")).pack(pady=(0, 20))
+        self.title_label = ttk.Label(main_frame, font=F(16, 'bold'))
+        self.title_label.pack(pady=(0, 20))
         
         # Form fields
         self._create_form_fields(main_frame)
         
         # Buttons
         self._create_buttons(main_frame)
-        
-        # Populate fields if editing
-        if self.product_data:
-            self._populate_fields()
-        
-        # Focus on first field
-        self.name_entry.focus()
-        
-        # Wait for dialog result
-        self.dialog.wait_window()
-        return self.result
+    
+    def _reset_fields(self):
+        """Clear values left over from the previous open"""
+        for var in (self.name_var, self.category_var, self.buy_price_var,
+                    self.sell_price_var, self.stock_var, self.barcode_var):
+            var.set('')
     
     def _create_form_fields(self, parent):
         """Create professional form fields"""
@@ -88,15 +236,23 @@ class ProductDialog:
         form_frame = ttk.LabelFrame(parent, text="Product Information", padding=20)
         form_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
         
+        # Field values are read through these variables
+        self.name_var = StringVar(self.dialog)
+        self.category_var = StringVar(self.dialog)
+        self.buy_price_var = StringVar(self.dialog)
+        self.sell_price_var = StringVar(self.dialog)
+        self.stock_var = StringVar(self.dialog)
+        self.barcode_var = StringVar(self.dialog)
+        
         # Product Name
-        ttk.Label(form_frame, text="Product Name *", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.name_entry = ttk.Entry(form_frame, font=("Segoe UI", 11), width=40)
+        ttk.Label(form_frame, text="Product Name *", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.name_entry = ttk.Entry(form_frame, textvariable=self.name_var, font=F(11), width=40)
         self.name_entry.pack(fill=X, pady=(0, 15))
         
         # Category
-        ttk.Label(form_frame, text="Category", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.category_combo = ttk.Combobox(form_frame, font=("Segoe UI", 11), width=37, state="normal")
-        self._load_categories()
+        ttk.Label(form_frame, text="Category", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.category_combo = ttk.Combobox(form_frame, textvariable=self.category_var, font=F(11),
+                                          width=37, state="normal")
         self.category_combo.pack(fill=X, pady=(0, 15))
         
         # Price fields in a row
@@ -106,15 +262,15 @@ class ProductDialog:
         # Buy Price
         buy_frame = ttk.Frame(price_frame)
         buy_frame.pack(side=LEFT, fill=X, expand=True, padx=(0, 10))
-        ttk.Label(buy_frame, text="Buy Price", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.buy_price_entry = ttk.Entry(buy_frame, font=("Segoe UI", 11))
+        ttk.Label(buy_frame, text="Buy Price", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.buy_price_entry = ttk.Entry(buy_frame, textvariable=self.buy_price_var, font=F(11))
         self.buy_price_entry.pack(fill=X)
         
         # Sell Price
         sell_frame = ttk.Frame(price_frame)
         sell_frame.pack(side=RIGHT, fill=X, expand=True)
-        ttk.Label(sell_frame, text="Sell Price", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.sell_price_entry = ttk.Entry(sell_frame, font=("Segoe UI", 11))
+        ttk.Label(sell_frame, text="Sell Price", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.sell_price_entry = ttk.Entry(sell_frame, textvariable=self.sell_price_var, font=F(11))
         self.sell_price_entry.pack(fill=X)
         
         # Stock and Barcode in a row
@@ -124,15 +280,15 @@ class ProductDialog:
         # Stock
         stock_left = ttk.Frame(stock_frame)
         stock_left.pack(side=LEFT, fill=X, expand=True, padx=(0, 10))
-        ttk.Label(stock_left, text="Stock Quantity", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.stock_entry = ttk.Entry(stock_left, font=("Segoe UI", 11))
+        ttk.Label(stock_left, text="Stock Quantity", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.stock_entry = ttk.Entry(stock_left, textvariable=self.stock_var, font=F(11))
         self.stock_entry.pack(fill=X)
         
         # Barcode
         barcode_right = ttk.Frame(stock_frame)
         barcode_right.pack(side=RIGHT, fill=X, expand=True)
-        ttk.Label(barcode_right, text="Barcode (Optional)", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.barcode_entry = ttk.Entry(barcode_right, font=("Segoe UI", 11))
+        ttk.Label(barcode_right, text="Barcode (Optional)", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.barcode_entry = ttk.Entry(barcode_right, textvariable=self.barcode_var, font=F(11))
         self.barcode_entry.pack(fill=X)
         
     def _create_buttons(self, parent):
@@ -141,22 +297,19 @@ class ProductDialog:
         buttons_frame.pack(fill=X, pady=(10, 0))
         
         # Cancel button
-        ttk.Button(buttons_frame, text="Cancel", bootstyle="secondary", 
-                  command=self._cancel).pack(side=RIGHT, padx=(10, 0))
+        self.cancel_button = ttk.Button(buttons_frame, text="Cancel", bootstyle="secondary")
+        self.cancel_button.pack(side=RIGHT, padx=(10, 0))
         
-        # Save button
-        save_text = "Add Product" if not self.product_data else "Save Changes"
-        ttk.Button(buttons_frame, text=save_text, bootstyle="primary",
-                  command=self._save).pack(side=RIGHT)
+        # Save button (text and command are set per open in show)
+        self.save_button = ttk.Button(buttons_frame, bootstyle="primary")
+        self.save_button.pack(side=RIGHT)
     
     def _load_categories(self):
         """Load categories for dropdown"""
         try:
-            categories = enhanced_data.get_categories()
-            category_names = [cat.get('name', str(cat)) for cat in categories]
-            self.category_combo['values'] = category_names
+            self.category_combo['values'] = _cached_category_names(_categories_version)
         except Exception as e:
-            logger.error(f"Error loading categories: {e}")
+            logger.error("Error loading categories: %s", e)
             self.category_combo['values'] = ['General', 'Electronics', 'Clothing', 'Food']
     
     def _populate_fields(self):
@@ -164,25 +317,27 @@ class ProductDialog:
         if not self.product_data:
             return
             
-        self.name_entry.insert(0, str(self.product_data.get('name', '')))
-        self.category_combo.set(str(self.product_data.get('category', '')))
-        self.buy_price_entry.insert(0, str(self.product_data.get('buy_price', '0.00')))
-        self.sell_price_entry.insert(0, str(self.product_data.get('sell_price', '0.00')))
-        self.stock_entry.insert(0, str(self.product_data.get('stock', '0')))
-        self.barcode_entry.insert(0, str(self.product_data.get('barcode', '')))
+        self.name_var.set(str(self.product_data.get('name', '')))
+        self.category_var.set(str(self.product_data.get('category', '')))
+        self.buy_price_var.set(str(self.product_data.get('buy_price', '0.00')))
+        self.sell_price_var.set(str(self.product_data.get('sell_price', '0.00')))
+        self.stock_var.set(str(self.product_data.get('stock', '0')))
+        self.barcode_var.set(str(self.product_data.get('barcode', '')))
     
     def _save(self):
         """Save product data with validation"""
+        name = self.name_var.get().strip()
+        
         # Validate required fields
-        if not self.name_entry.get().strip():
+        if not name:
             messagebox.showerror("Error", "Product name is required!")
             self.name_entry.focus()
             return
         
         try:
-            buy_price = float(self.buy_price_entry.get() or 0)
-            sell_price = float(self.sell_price_entry.get() or 0)
-            stock = int(self.stock_entry.get() or 0)
+            buy_price = float(self.buy_price_var.get() or 0)
+            sell_price = float(self.sell_price_var.get() or 0)
+            stock = int(self.stock_var.get() or 0)
             
             if buy_price < 0 or sell_price < 0:
                 messagebox.showerror("Error", "Prices cannot be negative!")
@@ -197,39 +352,60 @@ class ProductDialog:
         
         # Prepare result
         self.result = {
-            'name': self.name_entry.get().strip(),
-            'category': self.category_combo.get().strip(),
+            'name': name,
+            'category': self.category_var.get().strip(),
             'buy_price': buy_price,
             'sell_price': sell_price,
             'stock': stock,
-            'barcode': self.barcode_entry.get().strip()
+            'barcode': self.barcode_var.get().strip()
         }
         
         if self.product_data:
             self.result['id'] = self.product_data['id']
         
-        self.dialog.destroy()
+        self._hide()
     
     def _cancel(self):
         """Cancel dialog"""
-        self.dialog.destroy()
+        self._hide()
 
-class LossRecordDialog:
+class LossRecordDialog(_PooledDialogMixin):
     """Professional loss recording dialog for financial tracking"""
     
+    _POOLED_ATTRS = ('dialog', 'product_label', 'category_label', 'stock_label',
+                     'unit_value_label', 'quantity_entry', 'reason_combo', 'notes_text',
+                     'impact_label', 'record_button', 'cancel_button',
+                     'quantity_var', 'reason_var')
+    
+    _REASON_VALUES = ("💔 Damaged", "⏰ Expired", "🚨 Theft",
+                      "🥀 Spoilage", "💥 Breakage", "❓ Other")
+    
     def __init__(self, parent, product_data):
         self.parent = parent
         self.product_data = product_data
         self.result = None
         self.dialog = None
+        self._impact_after_id = None
     
     def show(self):
         """Show the professional loss recording dialog"""
-        self.dialog = Toplevel(self.parent)
-        self.dialog.title("Record Product Loss")
-        self.dialog.geometry("500x550")
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        if self._take_pooled():
+            self._reset_fields()
+            self.dialog.deiconify()
+        else:
+            self._build()
+            self._stash_pooled()
+        
+        # Constants for the impact preview, parsed once per open
+        self._current_stock = int(self.product_data.get('stock', 0) or 0)
+        self._unit_value = float(self.product_data.get('sell_price', 0) or 0)
+        self._impact_prefix = f"Impact: Stock will change from {self._current_stock} to "
+        
+        # Point the pooled widgets at this instance
+        self._show_product_info()
+        self.quantity_entry.bind('<KeyRelease>', self._on_quantity_change)
+        self.record_button.config(command=self._record_loss)
+        self.cancel_button.config(command=self._cancel)
         
         # Center dialog
         self.dialog.geometry("+%d+%d" % (
@@ -237,6 +413,20 @@ class LossRecordDialog:
             self.parent.winfo_rooty() + 50
         ))
         
+        # Focus on quantity
+        self.quantity_entry.focus()
+        
+        # Wait for result
+        self._wait_hidden()
+        return self.result
+    
+    def _build(self):
+        """Create the dialog window and its widgets"""
+        self.dialog = Toplevel(self.parent)
+        self.dialog.title("Record Product Loss")
+        self.dialog.geometry("500x550")
+        self.dialog.transient(self.parent)
+        
         # Main frame
         main_frame = ttk.Frame(self.dialog)
         main_frame.pack(fill=BOTH, expand=True, padx=20, pady=20)
@@ -246,7 +436,7 @@ class LossRecordDialog:
         title_frame.pack(fill=X, pady=(0, 20))
         
         ttk.Label(title_frame, text="⚠️ Record Product Loss", 
-                 font=("Segoe UI", 16, "bold"), foreground="#e74c3c").pack()
+                 font=F(16, 'bold'), foreground="#e74c3c").pack()
         
         # Product info
         self._create_product_info(main_frame)
@@ -256,28 +446,35 @@ class LossRecordDialog:
         
         # Buttons
         self._create_buttons(main_frame)
-        
-        # Focus on quantity
-        self.quantity_entry.focus()
-        
-        # Wait for result
-        self.dialog.wait_window()
-        return self.result
+    
+    def _reset_fields(self):
+        """Clear values left over from the previous open"""
+        self.quantity_var.set('')
+        self.reason_var.set('')
+        self.notes_text.delete('1.0', END)
+        self.impact_label.config(text="")
     
     def _create_product_info(self, parent):
-        """Display current product information"""
+        """Create the current product information labels"""
         info_frame = ttk.LabelFrame(parent, text="Product Information", padding=15)
         info_frame.pack(fill=X, pady=(0, 20))
         
-        # Product details
-        ttk.Label(info_frame, text=f"Product: {self.product_data['name']}", 
-                 font=("Segoe UI", 12, "bold")).pack(anchor=W, pady=2)
-        ttk.Label(info_frame, text=f"Category: {self.product_data.get('category', 'N/A')}", 
-                 font=("Segoe UI", 11)).pack(anchor=W, pady=2)
-        ttk.Label(info_frame, text=f"Current Stock: {self.product_data.get('stock', 0)} units", 
-                 font=("Segoe UI", 11)).pack(anchor=W, pady=2)
-        ttk.Label(info_frame, text=f"Unit Value: ${self.product_data.get('sell_price', 0):.2f}", 
-                 font=("Segoe UI", 11)).pack(anchor=W, pady=2)
+        # Product details (filled in by _show_product_info)
+        self.product_label = ttk.Label(info_frame, font=F(12, 'bold'))
+        self.product_label.pack(anchor=W, pady=2)
+        self.category_label = ttk.Label(info_frame, font=F(11))
+        self.category_label.pack(anchor=W, pady=2)
+        self.stock_label = ttk.Label(info_frame, font=F(11))
+        self.stock_label.pack(anchor=W, pady=2)
+        self.unit_value_label = ttk.Label(info_frame, font=F(11))
+        self.unit_value_label.pack(anchor=W, pady=2)
+    
+    def _show_product_info(self):
+        """Display current product information"""
+        self.product_label.config(text=f"Product: {self.product_data['name']}")
+        self.category_label.config(text=f"Category: {self.product_data.get('category', 'N/A')}")
+        self.stock_label.config(text=f"Current Stock: {self._current_stock} units")
+        self.unit_value_label.config(text=f"Unit Value: ${self._unit_value:.2f}")
     
     def _create_loss_form(self, parent):
         """Create loss recording form"""
@@ -285,55 +482,57 @@ class LossRecordDialog:
         form_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
         
         # Quantity lost
-        ttk.Label(form_frame, text="Quantity Lost *", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.quantity_entry = ttk.Entry(form_frame, font=("Segoe UI", 11))
+        ttk.Label(form_frame, text="Quantity Lost *", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.quantity_var = StringVar(self.dialog)
+        self.quantity_entry = ttk.Entry(form_frame, textvariable=self.quantity_var, font=F(11))
         self.quantity_entry.pack(fill=X, pady=(0, 15))
         
         # Loss reason
-        ttk.Label(form_frame, text="Reason for Loss *", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.reason_combo = ttk.Combobox(form_frame, font=("Segoe UI", 11), state="readonly")
-        self.reason_combo['values'] = [
-            "💔 Damaged", "⏰ Expired", "🚨 Theft", 
-            "🥀 Spoilage", "💥 Breakage", "❓ Other"
-        ]
+        ttk.Label(form_frame, text="Reason for Loss *", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.reason_var = StringVar(self.dialog)
+        self.reason_combo = ttk.Combobox(form_frame, textvariable=self.reason_var,
+                                         font=F(11), state="readonly")
+        self.reason_combo['values'] = self._REASON_VALUES
         self.reason_combo.pack(fill=X, pady=(0, 15))
         
         # Additional notes
-        ttk.Label(form_frame, text="Additional Notes", font=("Segoe UI", 11, "bold")).pack(anchor=W, pady=(0, 5))
-        self.notes_text = ttk.Text(form_frame, height=4, font=("Segoe UI", 10))
+        ttk.Label(form_frame, text="Additional Notes", font=F(11, 'bold')).pack(anchor=W, pady=(0, 5))
+        self.notes_text = ttk.Text(form_frame, height=4, font=F(10))
         self.notes_text.pack(fill=X, pady=(0, 15))
         
-        # Impact preview
-        self.impact_label = ttk.Label(form_frame, text="", font=("Segoe UI", 10, "italic"))
+        # Impact preview (quantity changes are bound in show)
+        self.impact_label = ttk.Label(form_frame, text="", font=F(10, 'italic'))
         self.impact_label.pack(anchor=W)
-        
-        # Bind quantity change to update impact
-        self.quantity_entry.bind('<KeyRelease>', self._update_impact_preview)
     
     def _create_buttons(self, parent):
         """Create dialog buttons"""
         buttons_frame = ttk.Frame(parent)
         buttons_frame.pack(fill=X)
         
-        ttk.Button(buttons_frame, text="Cancel", bootstyle="secondary",
-                  command=self._cancel).pack(side=RIGHT, padx=(10, 0))
+        self.cancel_button = ttk.Button(buttons_frame, text="Cancel", bootstyle="secondary")
+        self.cancel_button.pack(side=RIGHT, padx=(10, 0))
         
-        ttk.Button(buttons_frame, text="Record Loss", bootstyle="danger",
-                  command=self._record_loss).pack(side=RIGHT)
+        self.record_button = ttk.Button(buttons_frame, text="Record Loss", bootstyle="danger")
+        self.record_button.pack(side=RIGHT)
+    
+    def _on_quantity_change(self, event=None):
+        """Schedule the impact preview once typing pauses"""
+        if self._impact_after_id is not None:
+            self.dialog.after_cancel(self._impact_after_id)
+        self._impact_after_id = self.dialog.after(IMPACT_DEBOUNCE_MS, self._update_impact_preview)
     
     def _update_impact_preview(self, event=None):
         """Update impact preview as user types"""
+        self._impact_after_id = None
         try:
-            quantity = int(self.quantity_entry.get() or 0)
-            current_stock = int(self.product_data.get('stock', 0))
-            unit_value = float(self.product_data.get('sell_price', 0))
+            quantity = int(self.quantity_var.get() or 0)
             
             if quantity > 0:
-                new_stock = max(0, current_stock - quantity)
-                total_loss_value = quantity * unit_value
+                new_stock = max(0, self._current_stock - quantity)
+                total_loss_value = quantity * self._unit_value
                 
                 self.impact_label.config(
-                    text=f"Impact: Stock will change from {current_stock} to {new_stock} units. "
+                    text=f"{self._impact_prefix}{new_stock} units. "
                          f"Financial loss: ${total_loss_value:.2f}",
                     foreground="#e74c3c"
                 )
@@ -346,12 +545,12 @@ class LossRecordDialog:
         """Record the loss with validation"""
         # Validation
         try:
-            quantity = int(self.quantity_entry.get() or 0)
+            quantity = int(self.quantity_var.get() or 0)
             if quantity <= 0:
                 messagebox.showerror("Error", "Quantity lost must be greater than 0!")
                 return
             
-            current_stock = int(self.product_data.get('stock', 0))
+            current_stock = self._current_stock
             if quantity > current_stock:
                 if not messagebox.askyesno("Confirm", 
                     f"Loss quantity ({quantity}) exceeds current stock ({current_stock}). "
@@ -362,7 +561,8 @@ class LossRecordDialog:
             messagebox.showerror("Error", "Please enter a valid quantity!")
             return
         
-        if not self.reason_combo.get():
+        reason = self.reason_var.get()
+        if not reason:
             messagebox.showerror("Error", "Please select a reason for the loss!")
             return
         
@@ -376,16 +576,112 @@ class LossRecordDialog:
         self.result = {
             'product_id': self.product_data['id'],
             'quantity_lost': quantity,
-            'reason': self.reason_combo.get(),
+            'reason': reason,
             'notes': self.notes_text.get('1.0', END).strip(),
             'timestamp': datetime.datetime.now().isoformat()
         }
         
-        self.dialog.destroy()
+        self._close()
     
     def _cancel(self):
         """Cancel dialog"""
-        self.dialog.destroy()
+        self._close()
+    
+    def _close(self):
+        """Drop any pending impact preview and hide the dialog for reuse"""
+        if self._impact_after_id is not None:
+            self.dialog.after_cancel(self._impact_after_id)
+            self._impact_after_id = None
+        self._hide()
+
+# Modern 2025 color scheme
+MODERN_COLORS = {
+    'background': '#2B2B2B',
+    'card': '#383838',
+    'sidebar': '#1F1F1F',
+    'header': '#2D2D2D',
+    'text': '#FFFFFF',
+    'secondary_text': '#CCCCCC',
+    'accent': '#888888',
+    'primary': '#4285F4',
+    'success': '#4CAF50',
+    'warning': '#FF9800',
+    'danger': '#F44336',
+    'info': '#2196F3',
+    'border': '#555555',
+    'hover': '#4A4A4A'
+}
+
+# Row stripes by parity; stock status is shown by the glyph in the Status column
+_ROW_TAGS = ('evenrow', 'oddrow')
+_ROW_TAG_COLORS = {
+    'evenrow': MODERN_COLORS['card'],
+    'oddrow': MODERN_COLORS['background'],
+}
+
+# Bind tags shared by every widget of one kind, so hover handlers are bound once
+_CARD_TAG = "InventoryCard"
+_SIDEBAR_BTN_TAG = "InventorySidebarButton"
+_ACTION_BTN_TAG = "InventoryActionButton"
+
+# Lighter shades used while hovering over coloured buttons
+_HOVER_COLORS = {
+    MODERN_COLORS['primary']: '#5A9BF5',
+    MODERN_COLORS['success']: '#6CBF60',
+    MODERN_COLORS['warning']: '#FFB64D',
+    MODERN_COLORS['danger']: '#F66B6B',
+    MODERN_COLORS['info']: '#4FC3F7',
+    MODERN_COLORS['accent']: '#A8A8A8'
+}
+
+def _modern_button_spec(color_key):
+    return {'background': MODERN_COLORS[color_key], 'foreground': "white",
+            'borderwidth': 0, 'focuscolor': 'none'}
+
+def _modern_scrollbar_spec():
+    return {'background': MODERN_COLORS['card'], 'troughcolor': MODERN_COLORS['background'],
+            'borderwidth': 0, 'arrowcolor': MODERN_COLORS['text']}
+
+# (style name, options) applied once per theme by _setup_modern_styles
+_STYLE_SPECS = (
+    # Modern frame styles
+    ("Modern.TFrame", {'background': MODERN_COLORS['background'], 'relief': "flat"}),
+    ("Card.TFrame", {'background': MODERN_COLORS['card'], 'relief': "solid", 'borderwidth': 1}),
+    ("Header.TFrame", {'background': MODERN_COLORS['header'], 'relief': "flat"}),
+    ("Sidebar.TFrame", {'background': MODERN_COLORS['sidebar'], 'relief': "flat"}),
+    # Modern button styles with hover effects
+    ("ModernPrimary.TButton", _modern_button_spec('primary')),
+    ("ModernSuccess.TButton", _modern_button_spec('success')),
+    ("ModernWarning.TButton", _modern_button_spec('warning')),
+    ("ModernDanger.TButton", _modern_button_spec('danger')),
+    ("ModernInfo.TButton", _modern_button_spec('info')),
+    # Modern entry and combobox styles
+    ("Modern.TEntry", {'fieldbackground': MODERN_COLORS['card'], 'borderwidth': 1,
+                       'relief': "solid", 'insertcolor': MODERN_COLORS['text']}),
+    ("Modern.TCombobox", {'fieldbackground': MODERN_COLORS['card'], 'borderwidth': 1, 'relief': "solid"}),
+    # Modern treeview with enhanced styling
+    ("Modern.Treeview", {'background': MODERN_COLORS['card'], 'foreground': MODERN_COLORS['text'],
+                         'fieldbackground': MODERN_COLORS['card'], 'borderwidth': 1, 'relief': "solid",
+                         'rowheight': TREE_ROW_HEIGHT}),
+    ("Modern.Treeview.Heading", {'background': MODERN_COLORS['header'], 'foreground': MODERN_COLORS['text'],
+                                 'relief': "solid", 'borderwidth': 1}),
+    # Modern scrollbar styles
+    ("Modern.Vertical.TScrollbar", _modern_scrollbar_spec()),
+    ("Modern.Horizontal.TScrollbar", _modern_scrollbar_spec()),
+    # Modern label frame styles
+    ("ActionGroup.TLabelframe", {'background': MODERN_COLORS['background'],
+                                 'foreground': MODERN_COLORS['secondary_text'],
+                                 'borderwidth': 1, 'relief': "solid"}),
+    ("ActionGroup.TLabelframe.Label", {'background': MODERN_COLORS['background'],
+                                       'foreground': MODERN_COLORS['secondary_text']}),
+)
+
+# (style name, state map) applied alongside _STYLE_SPECS
+_STYLE_MAPS = (
+    # Configure treeview selection and hover colors
+    ("Modern.Treeview", {'background': [('selected', MODERN_COLORS['primary'])],
+                         'foreground': [('selected', 'white')]}),
+)
 
 class EnhancedInventoryPage(ttk.Frame):
     """
@@ -393,6 +689,22 @@ class EnhancedInventoryPage(ttk.Frame):
     Implements all UI/UX suggestions for enhanced user experience
     """
     
+    # Theme the modern styles were last configured for (shared by all pages)
+    _styles_initialized = None
+    
+    _SORT_VALUES = ("Name ↑", "Name ↓", "Stock ↑", "Stock ↓", "Price ↑", "Price ↓", "Category ↑")
+    
+    # Sort option -> (key on the precomputed product fields, reverse)
+    _SORTS = {
+        "Name ↑": (itemgetter('_name_lc'), False),
+        "Name ↓": (itemgetter('_name_lc'), True),
+        "Stock ↑": (itemgetter('_stock'), False),
+        "Stock ↓": (itemgetter('_stock'), True),
+        "Price ↑": (itemgetter('_sell'), False),
+        "Price ↓": (itemgetter('_sell'), True),
+        "Category ↑": (itemgetter('_cat_lc'), False),
+    }
+    
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
@@ -415,10 +727,45 @@ class EnhancedInventoryPage(ttk.Frame):
         
         # Data storage
         self.products_data = []
+        # Product dicts by their Treeview iid, which is the product ID as a string
+        self._products_by_id = {}
+        # Position in products_data of each product, by iid
+        self._position_by_id = {}
+        # Virtual window: only filtered_idx[_view_top:_view_top + _view_rows] are attached
+        self._view_top = 0
+        self._view_rows = TREE_DEFAULT_VISIBLE_ROWS
+        self._visible_iids = []
+        # Per table row: the stripe tag it currently carries
+        self._row_tag = {}
+        self._last_filter_key = None
+        self._products_by_category = {}
+        self._category_counts = Counter()
+        self._status_index = {'low_stock': set(), 'out_of_stock': set()}
+        self._trigrams = {}
+        self._stock_col = array('q')
+        self._sell_col = array('d')
+        self._sell_price_sum = 0.0
         self.categories_data = []
-        self.filtered_products = []
+        # Positions in products_data of the rows that pass the filters, in display order
+        self.filtered_idx = []
+        # Per sort option: rank of each product position in that order, built on first use
+        self._sort_ranks = {}
         self.selected_product = None
         
+        # Pending debounced search/filter redraw (see _schedule_display)
+        self._search_after_id = None
+        # Set while an idle redraw is queued (see _schedule_redraw)
+        self._redraw_pending = False
+        
+        # Incremented per load so results of superseded loads are dropped
+        self._load_generation = 0
+        self._load_future = None
+        # Pending debounced reload (see _schedule_load)
+        self._refresh_after_id = None
+        # Pending reset of a success message (see _toast)
+        self._toast_after_id = None
+        self._stats_render_pending = False
+        
         # Dashboard stats
         self.stats = {
             'total_products': 0,
@@ -431,26 +778,17 @@ class EnhancedInventoryPage(ttk.Frame):
         }
         
         # Modern 2025 color scheme
-        self.colors = {
-            'background': '#2B2B2B',
-            'card': '#383838',
-            'sidebar': '#1F1F1F',
-            'header': '#2D2D2D',
-            'text': '#FFFFFF',
-            'secondary_text': '#CCCCCC',
-            'accent': '#888888',
-            'primary': '#4285F4',
-            'success': '#4CAF50',
-            'warning': '#FF9800',
-            'danger': '#F44336',
-            'info': '#2196F3',
-            'border': '#555555',
-            'hover': '#4A4A4A'
-        }
+        self.colors = dict(MODERN_COLORS)
+        
+        # Widgets whose text is re-translated in place: (widget, source text)
+        self._i18n_widgets = []
+        # Action buttons disabled while a database write runs (see _submit)
+        self._action_buttons = []
         
         # Setup enhanced UI
         self._setup_modern_styles()
-        self._create_modern_ui()
+        self._bind_hover_classes()
+        self._build_modern_ui()
         self._load_data()
         
         # Register for internationalization
@@ -459,72 +797,64 @@ class EnhancedInventoryPage(ttk.Frame):
         """Setup modern 2025 styles with rounded corners and shadows"""
         style = ttk.Style()
         
-        # Modern frame styles
-        style.configure("Modern.TFrame", background=self.colors['background'], relief="flat")
-        style.configure("Card.TFrame", background=self.colors['card'], relief="solid", borderwidth=1)
-        style.configure("Header.TFrame", background=self.colors['header'], relief="flat")
-        style.configure("Sidebar.TFrame", background=self.colors['sidebar'], relief="flat")
-        
-        # Modern button styles with hover effects
-        style.configure("ModernPrimary.TButton", background=self.colors['primary'], foreground="white", borderwidth=0, focuscolor='none')
-        style.configure("ModernSuccess.TButton", background=self.colors['success'], foreground="white", borderwidth=0, focuscolor='none')
-        style.configure("ModernWarning.TButton", background=self.colors['warning'], foreground="white", borderwidth=0, focuscolor='none')
-        style.configure("ModernDanger.TButton", background=self.colors['danger'], foreground="white", borderwidth=0, focuscolor='none')
-        style.configure("ModernInfo.TButton", background=self.colors['info'], foreground="white", borderwidth=0, focuscolor='none')
-        
-        # Modern entry and combobox styles
-        style.configure("Modern.TEntry", fieldbackground=self.colors['card'], borderwidth=1, relief="solid", insertcolor=self.colors['text'])
-        style.configure("Modern.TCombobox", fieldbackground=self.colors['card'], borderwidth=1, relief="solid")
-        
-        # Modern treeview with enhanced styling
-        style.configure("Modern.Treeview", 
-                       background=self.colors['card'],
-                       foreground=self.colors['text'],
-                       fieldbackground=self.colors['card'],
-                       borderwidth=1,
-                       relief="solid")
-        
-        style.configure("Modern.Treeview.Heading",
-                       background=self.colors['header'],
-                       foreground=self.colors['text'],
-                       relief="solid",
-                       borderwidth=1)
-        
-        # Configure treeview selection and hover colors
-        style.map("Modern.Treeview", 
-                 background=[('selected', self.colors['primary'])],
-                 foreground=[('selected', 'white')])
-        
-        # Modern scrollbar styles
-        style.configure("Modern.Vertical.TScrollbar", 
-                       background=self.colors['card'],
-                       troughcolor=self.colors['background'],
-                       borderwidth=0,
-                       arrowcolor=self.colors['text'])
-        
-        style.configure("Modern.Horizontal.TScrollbar",
-                       background=self.colors['card'],
-                       troughcolor=self.colors['background'], 
-                       borderwidth=0,
-                       arrowcolor=self.colors['text'])
-        
-        # Modern label frame styles
-        style.configure("ActionGroup.TLabelframe",
-                       background=self.colors['background'],
-                       foreground=self.colors['secondary_text'],
-                       borderwidth=1,
-                       relief="solid")
-        
-        style.configure("ActionGroup.TLabelframe.Label",
-                       background=self.colors['background'],
-                       foreground=self.colors['secondary_text'])
-
-    def _create_modern_ui(self):
-        """Create the complete modern 2025 UI based on all suggestions"""
-        # Clear any existing widgets
-        for widget in self.winfo_children():
-            widget.destroy()
+        # ttk styles are global to the interpreter, so configure them once per theme
+        theme = style.theme_use()
+        if EnhancedInventoryPage._styles_initialized == theme:
+            return
+        
+        for name, options in _STYLE_SPECS:
+            style.configure(name, **options)
+        for name, options in _STYLE_MAPS:
+            style.map(name, **options)
         
+        EnhancedInventoryPage._styles_initialized = theme
+
+    def _bind_hover_classes(self):
+        """Bind hover/click handlers once per bind tag instead of per widget"""
+        self.bind_class(_CARD_TAG, "<Configure>", self._card_configure)
+        self.bind_class(_CARD_TAG, "<Enter>", self._card_enter)
+        self.bind_class(_CARD_TAG, "<Leave>", self._card_leave)
+        self.bind_class(_CARD_TAG, "<Button-1>", self._card_click)
+        self.bind_class(_SIDEBAR_BTN_TAG, "<Enter>", self._sidebar_enter)
+        self.bind_class(_SIDEBAR_BTN_TAG, "<Leave>", self._sidebar_leave)
+        self.bind_class(_ACTION_BTN_TAG, "<Enter>", self._action_enter)
+        self.bind_class(_ACTION_BTN_TAG, "<Leave>", self._action_leave)
+
+    @staticmethod
+    def _add_bindtag(widget, tag):
+        widget.bindtags((tag,) + widget.bindtags())
+
+    def _card_configure(self, e):
+        # Keep the value right-aligned and the title centered as the card resizes
+        card = e.widget
+        card.coords(card.value_item, e.width - 20, 18)
+        card.coords(card.title_item, e.width // 2, 75)
+
+    def _card_enter(self, e):
+        e.widget.config(bg=self.colors['hover'])
+
+    def _card_leave(self, e):
+        e.widget.config(bg=self.colors['card'])
+
+    def _card_click(self, e):
+        e.widget.command()
+
+    def _sidebar_enter(self, e):
+        if not e.widget.is_active:
+            e.widget.config(bg=self.colors['hover'])
+
+    def _sidebar_leave(self, e):
+        if not e.widget.is_active:
+            e.widget.config(bg=self.colors['sidebar'])
+
+    def _action_enter(self, e):
+        e.widget.config(bg=self._lighten_color(e.widget.orig_bg))
+
+    def _action_leave(self, e):
+        e.widget.config(bg=e.widget.orig_bg)
+
+    def _build_modern_ui(self):
+        """Create the complete modern 2025 UI once; language changes update it in place"""
         # === 1. TOP HEADER BAR (Search, Filters, Actions) ===
         self._create_top_header()
         
@@ -566,6 +896,7 @@ class EnhancedInventoryPage(ttk.Frame):
             command=self._go_back_to_menu
         )
         back_btn.pack(side=tk.LEFT, padx=(0, 20))
+        self._register_i18n(back_btn)
         
         # Modern title with icon
         title_container = ttk.Frame(left_section, style="Header.TFrame")
@@ -574,17 +905,18 @@ class EnhancedInventoryPage(ttk.Frame):
         title_label = tk.Label(
             title_container,
             text="📦 Professional Inventory Management",
-            font=("Segoe UI", 20, "bold"),
+            font=F(20, 'bold'),
             bg=self.colors['header'],
             fg=self.colors['text']
         )
         title_label.pack(side=tk.LEFT, pady=5)
+        self._register_i18n(title_label)
         
         # Status indicator with modern styling
         self.status_indicator = tk.Label(
             title_container,
             text="● Ready",
-            font=("Segoe UI", 12),
+            font=F(12),
             bg=self.colors['header'],
             fg=self.colors['success']
         )
@@ -602,7 +934,7 @@ class EnhancedInventoryPage(ttk.Frame):
         search_icon = tk.Label(
             search_container,
             text="🔍",
-            font=("Segoe UI", 14),
+            font=F(14),
             bg=self.colors['card'],
             fg=self.colors['text']
         )
@@ -611,7 +943,7 @@ class EnhancedInventoryPage(ttk.Frame):
         self.search_entry = ttk.Entry(
             search_container,
             textvariable=self.search_var,
-            font=("Segoe UI", 12),
+            font=F(12),
             width=25,
             style="Modern.TEntry"
         )
@@ -626,16 +958,17 @@ class EnhancedInventoryPage(ttk.Frame):
         category_label = tk.Label(
             filters_frame,
             text="Category:",
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=self.colors['header'],
             fg=self.colors['secondary_text']
         )
         category_label.grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self._register_i18n(category_label)
         
         self.category_combo = ttk.Combobox(
             filters_frame,
             textvariable=self.category_var,
-            font=("Segoe UI", 10),
+            font=F(10),
             width=15,
             state="readonly",
             style="Modern.TCombobox"
@@ -647,17 +980,18 @@ class EnhancedInventoryPage(ttk.Frame):
         sort_label = tk.Label(
             filters_frame,
             text="Sort:",
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=self.colors['header'],
             fg=self.colors['secondary_text']
         )
         sort_label.grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
+        self._register_i18n(sort_label)
         
         self.sort_combo = ttk.Combobox(
             filters_frame,
             textvariable=self.sort_var,
-            values=["Name ↑", "Name ↓", "Stock ↑", "Stock ↓", "Price ↑", "Price ↓", "Category ↑"],
-            font=("Segoe UI", 10),
+            values=self._SORT_VALUES,
+            font=F(10),
             width=12,
             state="readonly",
             style="Modern.TCombobox"
@@ -693,73 +1027,32 @@ class EnhancedInventoryPage(ttk.Frame):
             self.card_widgets[stat_key] = card
 
     def _create_dashboard_card(self, parent, icon, title, stat_key, color, command):
-        """Create a single modern dashboard card with hover effects"""
-        # Create card frame with modern styling
-        card_frame = tk.Frame(parent, bg=self.colors['card'], relief="solid", bd=1, cursor="hand2")
-        
-        # Add hover effects
-        def on_enter(e):
-            card_frame.config(bg=self.colors['hover'])
-        def on_leave(e):
-            card_frame.config(bg=self.colors['card'])
-        def on_click(e):
-            command()
-            
-        card_frame.bind("<Enter>", on_enter)
-        card_frame.bind("<Leave>", on_leave)
-        card_frame.bind("<Button-1>", on_click)
-        
-        # Card content with proper padding
-        content_frame = tk.Frame(card_frame, bg=self.colors['card'], padx=20, pady=15)
-        content_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Top row: Icon and value
-        top_frame = tk.Frame(content_frame, bg=self.colors['card'])
-        top_frame.pack(fill=tk.X)
-        
-        # Icon
-        icon_label = tk.Label(
-            top_frame,
-            text=icon,
-            font=("Segoe UI", 24),
-            bg=self.colors['card'],
-            fg=self.colors['text']
-        )
-        icon_label.pack(side=tk.LEFT)
+        """Create a single modern dashboard card drawn on one canvas"""
+        # One canvas per card: icon, value and title are canvas text items
+        card = tk.Canvas(parent, bg=self.colors['card'], height=100, relief="solid", bd=1,
+                         highlightthickness=0, cursor="hand2")
         
+        icon_item = card.create_text(20, 15, text=icon, anchor="nw",
+                                     font=F(24), fill=self.colors['text'])
         # Value (will be updated dynamically)
-        value_label = tk.Label(
-            top_frame,
-            text="0",
-            font=("Segoe UI", 20, "bold"),
-            bg=self.colors['card'],
-            fg=color
-        )
-        value_label.pack(side=tk.RIGHT)
+        value_item = card.create_text(0, 18, text="0", anchor="ne",
+                                      font=F(20, 'bold'), fill=color)
+        title_item = card.create_text(0, 75, text=tr(title), anchor="n",
+                                      font=F(11), fill=self.colors['secondary_text'])
         
-        # Title
-        title_label = tk.Label(
-            content_frame,
-            text=title,
-            font=("Segoe UI", 11),
-            bg=self.colors['card'],
-            fg=self.colors['secondary_text']
-        )
-        title_label.pack(pady=(10, 0))
+        # Resize, hover and click are handled by the shared card bind tag
+        self._add_bindtag(card, _CARD_TAG)
+        card.command = command
         
         # Store references for updates
-        card_frame.value_label = value_label
-        card_frame.title_label = title_label
-        card_frame.stat_key = stat_key
-        card_frame.content_frame = content_frame
-        
-        # Bind click event to all child widgets too
-        for widget in [content_frame, top_frame, icon_label, value_label, title_label]:
-            widget.bind("<Button-1>", on_click)
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-        
-        return card_frame
+        card.icon_item = icon_item
+        card.value_item = value_item
+        card.value_text = "0"
+        card.title_item = title_item
+        card.title_text = title
+        card.stat_key = stat_key
+        
+        return card
 
     def _create_collapsible_sidebar(self, parent):
         """Create modern collapsible sidebar with icons and enhanced organization"""
@@ -776,11 +1069,12 @@ class EnhancedInventoryPage(ttk.Frame):
         sidebar_title = tk.Label(
             sidebar_header,
             text="Navigation",
-            font=("Segoe UI", 14, "bold"),
+            font=F(14, 'bold'),
             bg=self.colors['sidebar'],
             fg=self.colors['text']
         )
         sidebar_title.pack(side=tk.LEFT, padx=(10, 0), pady=10)
+        self._register_i18n(sidebar_title)
         
         # Sidebar content container
         self.sidebar_content = tk.Frame(self.sidebar_frame, bg=self.colors['sidebar'])
@@ -802,7 +1096,7 @@ class EnhancedInventoryPage(ttk.Frame):
         tk.Label(
             categories_header,
             text="📂 Categories",
-            font=("Segoe UI", 12, "bold"),
+            font=F(12, 'bold'),
             bg=self.colors['sidebar'],
             fg=self.colors['text']
         ).pack(side=tk.LEFT, padx=15, pady=10)
@@ -828,7 +1122,7 @@ class EnhancedInventoryPage(ttk.Frame):
         tk.Label(
             actions_header,
             text="⚡ Quick Actions",
-            font=("Segoe UI", 12, "bold"),
+            font=F(12, 'bold'),
             bg=self.colors['sidebar'],
             fg=self.colors['text']
         ).pack(side=tk.LEFT, padx=15, pady=10)
@@ -850,14 +1144,16 @@ class EnhancedInventoryPage(ttk.Frame):
             btn = self._create_action_button(actions_container, text, command, color)
             btn.pack(fill=tk.X, pady=3)
 
-    def _create_sidebar_button(self, text, command, is_active=False):
+    def _create_sidebar_button(self, text, command, is_active=False, image=None):
         """Create a modern sidebar button with hover effects"""
         bg_color = self.colors['primary'] if is_active else self.colors['sidebar']
         
         btn = tk.Button(
             self.categories_container,
             text=text,
-            font=("Segoe UI", 10),
+            image=image or '',
+            compound=tk.LEFT,
+            font=F(10),
             bg=bg_color,
             fg=self.colors['text'],
             bd=0,
@@ -868,16 +1164,9 @@ class EnhancedInventoryPage(ttk.Frame):
             pady=8
         )
         
-        # Hover effects
-        def on_enter(e):
-            if not is_active:
-                btn.config(bg=self.colors['hover'])
-        def on_leave(e):
-            if not is_active:
-                btn.config(bg=self.colors['sidebar'])
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+        # Hover effects come from the shared sidebar bind tag
+        btn.is_active = is_active
+        self._add_bindtag(btn, _SIDEBAR_BTN_TAG)
         
         return btn
 
@@ -886,7 +1175,7 @@ class EnhancedInventoryPage(ttk.Frame):
         btn = tk.Button(
             parent,
             text=text,
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=color,
             fg="white",
             bd=0,
@@ -895,14 +1184,10 @@ class EnhancedInventoryPage(ttk.Frame):
             pady=8
         )
         
-        # Hover effects
-        def on_enter(e):
-            btn.config(bg=self._lighten_color(color))
-        def on_leave(e):
-            btn.config(bg=color)
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+        # Hover effects come from the shared action bind tag
+        btn.orig_bg = color
+        self._add_bindtag(btn, _ACTION_BTN_TAG)
+        self._action_buttons.append(btn)
         
         return btn
 
@@ -923,7 +1208,7 @@ class EnhancedInventoryPage(ttk.Frame):
         tk.Label(
             left_header,
             text="📋 Product Inventory Details",
-            font=("Segoe UI", 16, "bold"),
+            font=F(16, 'bold'),
             bg=self.colors['header'],
             fg=self.colors['text']
         ).pack(side=tk.LEFT, pady=15)
@@ -939,7 +1224,7 @@ class EnhancedInventoryPage(ttk.Frame):
         self.selection_info = tk.Label(
             info_container,
             text="No selection",
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=self.colors['header'],
             fg=self.colors['secondary_text']
         )
@@ -948,7 +1233,7 @@ class EnhancedInventoryPage(ttk.Frame):
         self.count_info = tk.Label(
             info_container,
             text="Showing 0 of 0 products",
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=self.colors['header'],
             fg=self.colors['secondary_text']
         )
@@ -969,6 +1254,7 @@ class EnhancedInventoryPage(ttk.Frame):
             style="Modern.Treeview",
             height=15
         )
+        self._tree_path = str(self.products_tree)
         
         # Configure columns with improved width and alignment
         column_config = {
@@ -984,19 +1270,20 @@ class EnhancedInventoryPage(ttk.Frame):
             "Barcode": {"width": 120, "anchor": tk.CENTER}
         }
         
-        # Configure each column with modern styling
+        # Configure each column with modern styling; only the name column
+        # stretches, so resizing the window does not re-layout every column
         for col, config in column_config.items():
             self.products_tree.heading(col, text=col, anchor=tk.CENTER)
             self.products_tree.column(col, 
                                     width=config["width"], 
                                     minwidth=60, 
-                                    anchor=config["anchor"])
+                                    anchor=config["anchor"],
+                                    stretch=(col == "Product Name"))
         
         # Enhanced scrollbars with modern styling
-        v_scrollbar = ttk.Scrollbar(
+        v_scrollbar = self._tree_vscroll = ttk.Scrollbar(
             table_frame, 
             orient=tk.VERTICAL, 
-            command=self.products_tree.yview, 
             style="Modern.Vertical.TScrollbar"
         )
         h_scrollbar = ttk.Scrollbar(
@@ -1006,7 +1293,13 @@ class EnhancedInventoryPage(ttk.Frame):
             style="Modern.Horizontal.TScrollbar"
         )
         
-        self.products_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        # The vertical scrollbar drives the virtual row window, not the tree's own view
+        v_scrollbar.configure(command=self._yscroll)
+        self.products_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.products_tree.bind('<Configure>', self._on_tree_configure)
+        self.products_tree.bind('<MouseWheel>', self._on_tree_mousewheel)
+        self.products_tree.bind('<Button-4>', self._on_tree_mousewheel)
+        self.products_tree.bind('<Button-5>', self._on_tree_mousewheel)
         
         # Grid layout with proper expansion
         self.products_tree.grid(row=0, column=0, sticky="nsew")
@@ -1027,20 +1320,9 @@ class EnhancedInventoryPage(ttk.Frame):
 
     def _configure_tree_styling(self):
         """Configure modern tree styling with color coding"""
-        # Configure alternating row colors for better readability
-        self.products_tree.tag_configure('evenrow', background=self.colors['card'])
-        self.products_tree.tag_configure('oddrow', background=self.colors['background'])
-        
-        # Status-based color coding with modern colors
-        self.products_tree.tag_configure('out_of_stock', 
-                                        background='#ffebee', 
-                                        foreground='#c62828')
-        self.products_tree.tag_configure('low_stock', 
-                                        background='#fff8e1', 
-                                        foreground='#f57f17')
-        self.products_tree.tag_configure('in_stock', 
-                                        background=self.colors['card'], 
-                                        foreground=self.colors['text'])
+        # Two stripe tags only; status colour would make Tk composite a tag per status
+        for tag, background in _ROW_TAG_COLORS.items():
+            self.products_tree.tag_configure(tag, background=background)
         self.products_tree.tag_configure('high_value', 
                                         background='#e8f5e8', 
                                         foreground='#2e7d32')
@@ -1087,7 +1369,7 @@ class EnhancedInventoryPage(ttk.Frame):
         tk.Label(
             title_frame,
             text=title,
-            font=("Segoe UI", 10, "bold"),
+            font=F(10, 'bold'),
             bg=self.colors['card'],
             fg=self.colors['secondary_text']
         ).pack(pady=5)
@@ -1101,7 +1383,7 @@ class EnhancedInventoryPage(ttk.Frame):
             btn = tk.Button(
                 buttons_frame,
                 text=text,
-                font=("Segoe UI", 9),
+                font=F(9),
                 bg=color,
                 fg="white",
                 bd=0,
@@ -1113,16 +1395,9 @@ class EnhancedInventoryPage(ttk.Frame):
             btn.grid(row=0, column=i, padx=3, pady=2, sticky="ew")
             
             # Modern hover effects
-            def make_hover(button, original_color):
-                def on_enter(e):
-                    button.config(bg=self._lighten_color(original_color))
-                def on_leave(e):
-                    button.config(bg=original_color)
-                return on_enter, on_leave
-            
-            enter_func, leave_func = make_hover(btn, color)
-            btn.bind("<Enter>", enter_func)
-            btn.bind("<Leave>", leave_func)
+            btn.orig_bg = color
+            self._add_bindtag(btn, _ACTION_BTN_TAG)
+            self._action_buttons.append(btn)
         
         # Configure button column weights
         for i in range(len(actions)):
@@ -1138,7 +1413,7 @@ class EnhancedInventoryPage(ttk.Frame):
         self.status_text = tk.Label(
             status_frame,
             text="Select a product for details",
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=self.colors['background'],
             fg=self.colors['secondary_text']
         )
@@ -1148,7 +1423,7 @@ class EnhancedInventoryPage(ttk.Frame):
         self.timestamp_label = tk.Label(
             status_frame,
             text="",
-            font=("Segoe UI", 10),
+            font=F(10),
             bg=self.colors['background'],
             fg=self.colors['accent']
         )
@@ -1156,18 +1431,12 @@ class EnhancedInventoryPage(ttk.Frame):
 
     # === MODERN UI UTILITY METHODS ===
     
-    def _lighten_color(self, color):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _lighten_color(color):
         """Lighten a color for hover effects"""
         # Simple color lightening for hover effects
-        color_map = {
-            self.colors['primary']: '#5A9BF5',
-            self.colors['success']: '#6CBF60',
-            self.colors['warning']: '#FFB64D',
-            self.colors['danger']: '#F66B6B',
-            self.colors['info']: '#4FC3F7',
-            self.colors['accent']: '#A8A8A8'
-        }
-        return color_map.get(color, '#6A6A6A')
+        return _HOVER_COLORS.get(color, '#6A6A6A')
     
     def _go_back_to_menu(self):
         """Navigate back to main menu"""
@@ -1175,59 +1444,189 @@ class EnhancedInventoryPage(ttk.Frame):
 
     # === DATA LOADING AND MANAGEMENT ===
     
+    def _schedule_load(self):
+        """Reload once a burst of refresh requests has settled"""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(REFRESH_DEBOUNCE_MS, self._load_data)
+
     def _load_data(self):
-        """Load products data with modern error handling and status updates"""
+        """Start loading products and categories on a worker thread"""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        self._load_generation += 1
+        self.status_indicator.config(text="● Loading...", fg=self.colors['warning'])
+        # A load still waiting in the queue is superseded by this one
+        if self._load_future is not None:
+            self._load_future.cancel()
+        self._load_future = _LOAD_EXECUTOR.submit(self._load_data_worker, self._load_generation,
+                                                  self._products_by_id)
+
+    def _load_data_worker(self, generation, previous):
+        """Fetch inventory data off the Tk main thread.
+        
+        ``previous`` maps iids to the currently loaded products; rows whose
+        database fields are unchanged reuse those already enriched dicts.
+        """
         try:
-            self.status_indicator.config(text="● Loading...", fg=self.colors['warning'])
-            self.update_idletasks()
+            # Fetch categories alongside products so the two queries overlap
+            categories_future = _QUERY_EXECUTOR.submit(enhanced_data.get_categories)
             
             # Load products using the fixed enhanced data access
-            self.products_data = enhanced_data.get_products()
-            self.categories_data = enhanced_data.get_categories()
+            products = enhanced_data.get_products()
+            categories = categories_future.result()
+            
+            # Precompute numeric and lowercased fields, reusing unchanged products
+            for i, product in enumerate(products):
+                old = previous.get(str(product.get('id', '')))
+                if old is not None and all(old.get(k) == v for k, v in product.items()):
+                    products[i] = old
+                else:
+                    self._enrich_product(product)
+            trigrams = self._build_trigram_index(products)
+        except Exception as e:
+            logger.error("Error loading inventory data: %s", e)
+            self.after(0, self._on_load_error, generation, e)
+            return
+        
+        self.after(0, self._apply_loaded_data, generation, products, categories, trigrams)
+
+    def _apply_loaded_data(self, generation, products, categories, trigrams):
+        """Populate the page with freshly loaded data (runs on the main thread)"""
+        if generation != self._load_generation or not self.winfo_exists():
+            return
+        
+        try:
+            previous = self._products_by_id
+            self.products_data = products
+            self.categories_data = categories
+            self._trigrams = trigrams
+            self._index_products()
             
             # Update all UI components
             self._update_dashboard_stats()
             self._update_categories_dropdown()
             self._update_categories_sidebar()
+            self._sync_product_rows(previous)
             self._update_products_display()
             
             self.status_indicator.config(text="● Ready", fg=self.colors['success'])
             self.timestamp_label.config(text=f"Last updated: {datetime.datetime.now().strftime('%H:%M:%S')}")
             
         except Exception as e:
-            logger.error(f"Error loading inventory data: {e}")
-            self.status_indicator.config(text="● Error", fg=self.colors['danger'])
-            self.status_text.config(text=f"Error loading data: {str(e)}")
+            logger.error("Error loading inventory data: %s", e)
+            self._on_load_error(generation, e)
 
-    def _update_dashboard_stats(self):
-        """Update modern dashboard cards with current statistics"""
-        if not self.products_data:
+    def _on_load_error(self, generation, error):
+        """Show a failed load in the status bar"""
+        if generation != self._load_generation or not self.winfo_exists():
             return
-        
+        self.status_indicator.config(text="● Error", fg=self.colors['danger'])
+        self.status_text.config(text=f"Error loading data: {str(error)}")
+
+    def _index_products(self):
+        """Group product positions by category so category filters skip full scans"""
+        # One pass builds the category groups and the stock status filters
+        by_category = defaultdict(set)
+        status_index = {'low_stock': set(), 'out_of_stock': set()}
+        self._products_by_id = {p['_iid']: p for p in self.products_data}
+        self._position_by_id = {p['_iid']: idx for idx, p in enumerate(self.products_data)}
+        for idx, product in enumerate(self.products_data):
+            by_category[product.get('category', '')].add(idx)
+            status = self._stock_status(product['_stock'])
+            if status is not None:
+                status_index[status].add(idx)
+        self._products_by_category = dict(by_category)
+        self._sort_ranks = {}
+        self._category_counts = Counter({name: len(idxs) for name, idxs in by_category.items()})
+        self._status_index = status_index
+        
+        # Column copies of the numeric fields for the aggregate stats
+        self._stock_col = array('q', (p['_stock'] for p in self.products_data))
+        self._sell_col = array('d', (p['_sell'] for p in self.products_data))
+        
+        self.stats['categories_count'] = len(self._category_counts)
+        top = self._category_counts.most_common(1)
+        self.stats['top_category'] = top[0][0] if top else 'Unknown'
+
+    def _update_dashboard_stats(self):
+        """Recompute dashboard statistics from the full product list"""
         # Calculate comprehensive statistics
         total_products = len(self.products_data)
-        low_stock = sum(1 for p in self.products_data 
-                       if 0 < int(p.get('stock', 0)) <= 5)
-        out_of_stock = sum(1 for p in self.products_data 
-                          if int(p.get('stock', 0)) == 0)
-        
-        total_value = sum(
-            float(p.get('sell_price', 0)) * int(p.get('stock', 0)) 
-            for p in self.products_data
+        stock, sell = self._stock_col, self._sell_col
+        out_of_stock = len(self._status_index['out_of_stock'])
+        low_stock = len(self._status_index['low_stock'])
+        
+        total_value = sum(map(mul, sell, stock))
+        self._sell_price_sum = sum(sell)
+        
+        self.stats.update(
+            total_products=total_products,
+            low_stock_count=low_stock,
+            out_of_stock_count=out_of_stock,
+            total_value=total_value,
+            avg_price=self._sell_price_sum / total_products if total_products else 0.0
         )
-        
+        self._render_dashboard_stats()
+
+    def _apply_delta(self, before, after):
+        """Adjust running statistics for one product change.
+        
+        ``before`` is the product as it was (None when added) and ``after`` the
+        product as saved (None when deleted), so a mutation costs O(1) instead
+        of a rescan of products_data.
+        """
+        stats = self.stats
+        counts = self._category_counts
+        for product, sign in ((before, -1), (after, 1)):
+            if not product:
+                continue
+            stock, sell_price = product['_stock'], product['_sell']
+            
+            stats['total_products'] += sign
+            stats['total_value'] += sign * sell_price * stock
+            self._sell_price_sum += sign * sell_price
+            status = self._stock_status(stock)
+            if status == 'out_of_stock':
+                stats['out_of_stock_count'] += sign
+            elif status == 'low_stock':
+                stats['low_stock_count'] += sign
+            category = product.get('category', '')
+            counts[category] += sign
+            if counts[category] <= 0:
+                del counts[category]
+        
+        total = stats['total_products']
+        stats['avg_price'] = self._sell_price_sum / total if total else 0.0
+        stats['categories_count'] = len(counts)
+        top = counts.most_common(1)
+        stats['top_category'] = top[0][0] if top else 'Unknown'
+        self._render_dashboard_stats()
+
+    def _render_dashboard_stats(self):
+        """Schedule one card refresh for however many stat changes land before idle"""
+        if not self._stats_render_pending:
+            self._stats_render_pending = True
+            self.after_idle(self._flush_dashboard_stats)
+
+    def _flush_dashboard_stats(self):
+        """Push the current statistics into the dashboard cards"""
+        self._stats_render_pending = False
         # Update card values with proper formatting
         stats_mapping = {
-            'total_products': str(total_products),
-            'low_stock_count': str(low_stock),
-            'out_of_stock_count': str(out_of_stock),
-            'total_value': f"${total_value:,.2f}"
+            'total_products': str(self.stats['total_products']),
+            'low_stock_count': str(self.stats['low_stock_count']),
+            'out_of_stock_count': str(self.stats['out_of_stock_count']),
+            'total_value': f"${self.stats['total_value']:,.2f}"
         }
         
         for stat_key, value in stats_mapping.items():
-            if stat_key in self.card_widgets:
-                card = self.card_widgets[stat_key]
-                card.value_label.config(text=value)
+            card = self.card_widgets.get(stat_key)
+            # Only cards whose text changed cost a Tcl call
+            if card is not None and card.value_text != value:
+                card.itemconfigure(card.value_item, text=value)
+                card.value_text = value
 
     def _update_categories_dropdown(self):
         """Update category dropdown with current categories"""
@@ -1238,144 +1637,454 @@ class EnhancedInventoryPage(ttk.Frame):
 
     def _update_categories_sidebar(self):
         """Update sidebar categories with modern styling and badges"""
-        # Clear existing category buttons
-        for btn in getattr(self, 'category_buttons', []):
-            btn.destroy()
-        self.category_buttons = []
-        
-        # Add category buttons with product counts
-        for category in self.categories_data:
+        # Reuse the existing buttons; only create new ones when the list grows
+        buttons = self.category_buttons
+        for category, btn in zip_longest(self.categories_data, list(buttons)):
+            if category is None:
+                # Surplus button: hide it for a later refresh
+                btn.pack_forget()
+                continue
+            
             name = category.get('name', str(category))
-            count = sum(1 for p in self.products_data if p.get('category') == name)
+            count = self._category_counts[name]
+            icon = category_icon(name)
+            btn_text = f" {name} ({count})" if icon else f"📁 {name} ({count})"
             
-            btn_text = f"🧃 {name} ({count})" if name == "Juice" else f"📁 {name} ({count})"
-            btn = self._create_sidebar_button(btn_text, lambda n=name: self._filter_by_category(n))
-            btn.pack(fill=tk.X, pady=2)
-            self.category_buttons.append(btn)
+            if btn is None:
+                btn = self._create_sidebar_button(btn_text, None, image=icon)
+                # One command per button for its lifetime; it reads the current category
+                btn.config(command=lambda b=btn: self._filter_by_category(b.category_name))
+                buttons.append(btn)
+            elif btn.category_name != name or btn.cget('text') != btn_text:
+                btn.config(text=btn_text, image=icon or '')
+            btn.category_name = name
+            if not btn.winfo_manager():
+                btn.pack(fill=tk.X, pady=2)
+
+    def _apply_local_change(self, before, after):
+        """Patch products_data and the table for one saved product instead of reloading.
+        
+        ``before`` is the loaded product (None when added) and ``after`` the
+        saved fields (None when deleted). Only the affected table row is touched.
+        """
+        self._apply_local_changes([(before, after)])
+
+    def _apply_local_changes(self, changes):
+        """Apply several (before, after) product changes to the changed products' index entries"""
+        # A load that started before this change would bring back stale rows
+        self._load_generation += 1
+        
+        products = self.products_data
+        positions = self._position_by_id
+        tree = self.products_tree
+        categories = set(self._products_by_category)
+        # Only adds, deletes and edits that can move a row in or out of the
+        # current view (or reorder it) need the filters re-run
+        refilter = False
+        for before, after in changes:
+            if after is None:
+                self._remove_product(before)
+                self._apply_delta(before, None)
+                iid = before['_iid']
+                if self._row_tag.pop(iid, None) is not None:
+                    tree.delete(iid)
+                    if iid in self._visible_iids:
+                        self._visible_iids.remove(iid)
+                refilter = True
+            elif before is None:
+                product = dict(after)
+                self._enrich_product(product)
+                positions[product['_iid']] = len(products)
+                products.append(product)
+                self._products_by_id[product['_iid']] = product
+                self._stock_col.append(product['_stock'])
+                self._sell_col.append(product['_sell'])
+                self._index_product(positions[product['_iid']], product)
+                self._apply_delta(None, product)
+                refilter = True
+            else:
+                old = dict(before)
+                idx = positions[before['_iid']]
+                self._unindex_product(idx, before)
+                before.update(after)
+                self._enrich_product(before)
+                self._index_product(idx, before)
+                self._stock_col[idx] = before['_stock']
+                self._sell_col[idx] = before['_sell']
+                self._apply_delta(old, before)
+                if before['_iid'] in self._row_tag:
+                    tree.item(before['_iid'], values=before['_row'])
+                if self._view_fields(old) != self._view_fields(before):
+                    refilter = True
+        
+        if categories != self._products_by_category.keys():
+            # get_categories() lists the distinct product categories, so derive them locally
+            self.categories_data = [{'name': name, 'id': name}
+                                    for name in sorted(n for n in self._products_by_category if n is not None)]
+            self._update_categories_dropdown()
+        self._update_categories_sidebar()
+        if refilter:
+            # Sort ranks are per position, and positions or sort keys have changed
+            self._sort_ranks = {}
+            self._last_filter_key = None
+            self._update_products_display()
+        self.status_indicator.config(text="● Ready", fg=self.colors['success'])
+
+    def _remove_product(self, product):
+        """Drop a product by moving the last product into its position"""
+        products = self.products_data
+        positions = self._position_by_id
+        idx = positions.pop(product['_iid'])
+        self._unindex_product(idx, product)
+        del self._products_by_id[product['_iid']]
+        last = len(products) - 1
+        if idx != last:
+            moved = products[last]
+            self._unindex_product(last, moved)
+            products[idx] = moved
+            positions[moved['_iid']] = idx
+            self._index_product(idx, moved)
+            self._stock_col[idx] = self._stock_col[last]
+            self._sell_col[idx] = self._sell_col[last]
+        products.pop()
+        self._stock_col.pop()
+        self._sell_col.pop()
+
+    def _index_product(self, idx, product):
+        """Add one product position to the category, status and trigram indexes"""
+        self._products_by_category.setdefault(product.get('category', ''), set()).add(idx)
+        status = self._stock_status(product['_stock'])
+        if status is not None:
+            self._status_index[status].add(idx)
+        trigrams = self._trigrams
+        key = product['_search_key']
+        for j in range(len(key) - 2):
+            trigrams.setdefault(key[j:j + 3], set()).add(idx)
+
+    def _unindex_product(self, idx, product):
+        """Remove one product position from the category, status and trigram indexes"""
+        category = product.get('category', '')
+        group = self._products_by_category.get(category)
+        if group is not None:
+            group.discard(idx)
+            if not group:
+                del self._products_by_category[category]
+        status = self._stock_status(product['_stock'])
+        if status is not None:
+            self._status_index[status].discard(idx)
+        trigrams = self._trigrams
+        key = product['_search_key']
+        for j in range(len(key) - 2):
+            postings = trigrams.get(key[j:j + 3])
+            if postings is not None:
+                postings.discard(idx)
+
+    @staticmethod
+    def _view_fields(product):
+        """Fields that decide whether and where a product shows in the filtered table"""
+        return (product.get('category', ''), product['_stock'], product['_sell'], product['_search_key'])
+
+    def _sync_product_rows(self, previous):
+        """Carry existing table rows over to a reload, touching only changed ones.
+        
+        ``previous`` maps iids to the products shown before the reload. Rows are
+        only ever created for products that were displayed, so this is bounded
+        by what the user has scrolled through rather than by the catalogue size.
+        """
+        tree = self.products_tree
+        current = self._products_by_id
+        gone, changed = [], []
+        for iid in self._row_tag:
+            product = current.get(iid)
+            if product is None:
+                gone.append(iid)
+            elif product['_row'] != previous[iid]['_row']:
+                changed.append((iid, product['_row']))
+        
+        # Same as _render_window: big batches run with the tree unmapped
+        unmap = len(gone) + len(changed) > TREE_HIDE_THRESHOLD
+        if unmap:
+            tree.grid_remove()
+        try:
+            for iid, values in changed:
+                tree.item(iid, values=values)
+            if gone:
+                tree.delete(*gone)
+        finally:
+            if unmap:
+                tree.grid()
+        if gone:
+            for iid in gone:
+                del self._row_tag[iid]
+            self._visible_iids = [iid for iid in self._visible_iids if iid in self._row_tag]
+        self._last_filter_key = None
+
+    def _product_row_iid(self, product):
+        """Return the Treeview row for a product, inserting it on first use"""
+        iid = product['_iid']
+        if iid in self._row_tag:
+            return iid
+        
+        # Direct Tcl insert; Treeview.insert would re-format the option dict per row
+        row_tag = _ROW_TAGS[0]
+        self.tk.call(self._tree_path, 'insert', '', 'end', '-id', iid, '-values', product['_row'],
+                     '-tags', row_tag)
+        self._row_tag[iid] = row_tag
+        return iid
 
     def _update_products_display(self):
-        """Update products table with enhanced styling and modern features"""
-        # Clear existing items
-        for item in self.products_tree.get_children():
-            self.products_tree.delete(item)
+        """Show the first page of filtered products by detaching and moving rows"""
+        # Nothing to do when the filter inputs are the same as last time
+        key = (self.search_var.get().strip().lower(), self.current_category_filter,
+               self.current_filter, self.sort_var.get())
+        if key == self._last_filter_key:
+            return
+        self._last_filter_key = key
         
         # Apply current filters
         self._apply_current_filters()
         
-        # Populate table with enhanced styling
-        for i, product in enumerate(self.filtered_products):
-            # Calculate enhanced values
-            buy_price = float(product.get('buy_price', 0))
-            sell_price = float(product.get('sell_price', 0))
-            stock = int(product.get('stock', 0))
-            total_value = sell_price * stock
-            
-            # Calculate margin percentage
-            margin_text = f"{((sell_price - buy_price) / buy_price) * 100:.1f}%" if buy_price > 0 else "N/A"
-            
-            # Enhanced status with modern indicators
-            if stock == 0:
-                status = "❌ Out of Stock"
-                tag = 'out_of_stock'
-            elif stock <= 5:
-                status = "⚠️ Low Stock"  
-                tag = 'low_stock'
-            else:
-                status = "✅ In Stock"
-                tag = 'in_stock'
-            
-            # Prepare enhanced row values
-            values = (
-                product.get('id', ''),
-                product.get('name', ''),
-                product.get('category', ''),
-                f"${buy_price:.2f}",
-                f"${sell_price:.2f}",
-                f"{stock:,}",
-                f"${total_value:,.2f}",
-                status,
-                margin_text,
-                product.get('barcode', 'N/A') or 'N/A'
-            )
-            
-            # Insert with alternating row colors and status tags
-            row_tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            tags = (row_tag, tag)
-            self.products_tree.insert('', 'end', values=values, tags=tags)
+        self._view_top = 0
+        self._render_window()
         
         # Update count information
         total_count = len(self.products_data)
-        filtered_count = len(self.filtered_products)
+        filtered_count = len(self.filtered_idx)
         self.count_info.config(text=f"Showing {filtered_count} of {total_count} products")
 
+    def _render_window(self):
+        """Attach only the filtered rows inside the virtual window, in order"""
+        total = len(self.filtered_idx)
+        rows = self._view_rows
+        top = self._view_top = max(0, min(self._view_top, total - rows))
+        
+        tree = self.products_tree
+        products = self.products_data
+        visible = [self._product_row_iid(products[i]) for i in self.filtered_idx[top:top + rows]]
+        
+        # Only the previous window can be attached, so only it needs detaching.
+        # Large batches run with the tree unmapped so Tk lays it out only once.
+        hidden = set(self._visible_iids).difference(visible)
+        unmap = len(hidden) + len(visible) > TREE_HIDE_THRESHOLD
+        if unmap:
+            tree.grid_remove()
+        try:
+            if hidden:
+                tree.detach(*hidden)
+            row_tag = self._row_tag
+            for index, iid in enumerate(visible):
+                tree.move(iid, '', index)
+                # Stripe by position in the filtered list so scrolling keeps each row's tag
+                tag = _ROW_TAGS[(top + index) & 1]
+                if row_tag[iid] != tag:
+                    tree.item(iid, tags=(tag,))
+                    row_tag[iid] = tag
+        finally:
+            if unmap:
+                tree.grid()
+        self._visible_iids = visible
+        
+        # Size the scrollbar thumb as if every filtered row were in the tree
+        if total:
+            self._tree_vscroll.set(top / total, (top + len(visible)) / total)
+        else:
+            self._tree_vscroll.set(0.0, 1.0)
+        tree.update_idletasks()
+
+    def _yscroll(self, *args):
+        """Scrollbar command: move the virtual window ('moveto' or 'scroll')"""
+        if args[0] == 'moveto':
+            self._view_top = int(float(args[1]) * len(self.filtered_idx))
+        elif args[0] == 'scroll':
+            step = self._view_rows if args[2] == 'pages' else 1
+            self._view_top += int(args[1]) * step
+        self._render_window()
+
+    def _on_tree_mousewheel(self, event):
+        """Scroll the virtual window instead of the tree's own view"""
+        if event.num == 4 or event.delta > 0:
+            self._yscroll('scroll', -3, 'units')
+        else:
+            self._yscroll('scroll', 3, 'units')
+        return "break"
+
+    def _on_tree_configure(self, event):
+        """Resize the virtual window to the rows that fit below the headings"""
+        rows = max(1, event.height // TREE_ROW_HEIGHT - 1)
+        if rows != self._view_rows:
+            self._view_rows = rows
+            self._render_window()
+
     def _apply_current_filters(self):
         """Apply current search, category, and sort filters"""
-        # Start with all products
-        filtered = list(self.products_data)
+        products = self.products_data
+        
+        # Candidate positions: the selected category's, narrowed by the stock status sets
+        candidates = None
+        if self.current_category_filter != "all":
+            candidates = sorted(self._products_by_category.get(self.current_category_filter, ()))
+        status_set = self._status_index.get(self.current_filter)
+        if status_set is not None:
+            candidates = (sorted(status_set) if candidates is None
+                          else [i for i in candidates if i in status_set])
         
-        # Apply search filter
+        # Apply search filter; queries of 3+ characters narrow through the trigram index
         search_term = self.search_var.get().lower().strip()
+        if len(search_term) >= 3:
+            hits = self._trigram_candidates(search_term)
+            candidates = (sorted(hits) if candidates is None
+                          else [i for i in candidates if i in hits])
+        
+        filtered = range(len(products)) if candidates is None else candidates
         if search_term:
-            filtered = [p for p in filtered 
-                       if search_term in p.get('name', '').lower() or 
-                          search_term in p.get('category', '').lower() or
-                          search_term in str(p.get('barcode', '')).lower()]
+            # Trigram hits can be false positives, so the substring test stays
+            filtered = [i for i in filtered if search_term in products[i]['_search_key']]
         
-        # Apply category filter
-        if self.current_category_filter != "all":
-            filtered = [p for p in filtered if p.get('category') == self.current_category_filter]
-        
-        # Apply status filter
-        if self.current_filter == "low_stock":
-            filtered = [p for p in filtered if 0 < int(p.get('stock', 0)) <= 5]
-        elif self.current_filter == "out_of_stock":
-            filtered = [p for p in filtered if int(p.get('stock', 0)) == 0]
-        elif self.current_filter == "high_value":
+        # High value is relative to the products that are left
+        if self.current_filter == "high_value":
             if filtered:
-                avg_value = sum(float(p.get('sell_price', 0)) for p in filtered) / len(filtered)
-                filtered = [p for p in filtered if float(p.get('sell_price', 0)) > avg_value]
-        
-        # Apply sorting
-        sort_option = self.sort_var.get()
-        if sort_option == "Name ↑":
-            filtered.sort(key=lambda p: p.get('name', '').lower())
-        elif sort_option == "Name ↓":
-            filtered.sort(key=lambda p: p.get('name', '').lower(), reverse=True)
-        elif sort_option == "Stock ↑":
-            filtered.sort(key=lambda p: int(p.get('stock', 0)))
-        elif sort_option == "Stock ↓":
-            filtered.sort(key=lambda p: int(p.get('stock', 0)), reverse=True)
-        elif sort_option == "Price ↑":
-            filtered.sort(key=lambda p: float(p.get('sell_price', 0)))
-        elif sort_option == "Price ↓":
-            filtered.sort(key=lambda p: float(p.get('sell_price', 0)), reverse=True)
-        elif sort_option == "Category ↑":
-            filtered.sort(key=lambda p: p.get('category', ''))
-        
-        self.filtered_products = filtered
+                sell = self._sell_col
+                avg_value = sum(sell[i] for i in filtered) / len(filtered)
+                filtered = [i for i in filtered if sell[i] > avg_value]
+        
+        # Apply sorting by each position's precomputed rank
+        rank = self._sort_rank(self.sort_var.get())
+        if rank is not None:
+            filtered = sorted(filtered, key=rank.__getitem__)
+        
+        self.filtered_idx = list(filtered)
+
+    def _sort_rank(self, sort_option):
+        """Rank of every product position under ``sort_option``, or None if unknown"""
+        rank = self._sort_ranks.get(sort_option)
+        if rank is None:
+            sort_spec = self._SORTS.get(sort_option)
+            if sort_spec is None:
+                return None
+            key, reverse = sort_spec
+            products = self.products_data
+            order = sorted(range(len(products)), key=lambda i: key(products[i]), reverse=reverse)
+            rank = array('l', [0]) * len(products)
+            for position, i in enumerate(order):
+                rank[i] = position
+            self._sort_ranks[sort_option] = rank
+        return rank
 
+    @staticmethod
+    def _build_trigram_index(products):
+        """Map every 3-character slice of the search keys to product positions"""
+        trigrams = defaultdict(set)
+        for i, product in enumerate(products):
+            key = product['_search_key']
+            for j in range(len(key) - 2):
+                trigrams[key[j:j + 3]].add(i)
+        return dict(trigrams)
+
+    def _trigram_candidates(self, term):
+        """Positions of products whose search key holds every trigram of ``term``"""
+        sets = sorted((self._trigrams.get(term[j:j + 3], set()) for j in range(len(term) - 2)),
+                      key=len)
+        return sets[0].intersection(*sets[1:])
+
+    @staticmethod
+    def _stock_status(stock):
+        """Status index a stock level belongs to, or None when it is in stock"""
+        if stock == 0:
+            return 'out_of_stock'
+        if 0 < stock <= 5:
+            return 'low_stock'
+        return None
+
+    @staticmethod
+    def _enrich_product(product):
+        """Store the parsed numbers, lowercased text and formatted row for a product"""
+        buy = product['_buy'] = float(product.get('buy_price', 0) or 0)
+        sell = product['_sell'] = float(product.get('sell_price', 0) or 0)
+        stock = product['_stock'] = int(product.get('stock', 0) or 0)
+        product['_total'] = sell * stock
+        product['_iid'] = str(product.get('id', ''))
+        product['_margin'] = ((sell - buy) / buy * 100) if buy > 0 else None
+        product['_name_lc'] = str(product.get('name') or '').lower()
+        product['_cat_lc'] = str(product.get('category') or '').lower()
+        product['_bc_lc'] = str(product.get('barcode') or '').lower()
+        # Newline-separated so a query cannot match across two fields
+        product['_search_key'] = "\n".join((product['_name_lc'], product['_cat_lc'], product['_bc_lc']))
+        
+        # Enhanced status with modern indicators
+        if stock == 0:
+            status = "❌ Out of Stock"
+            product['_status_tag'] = 'out_of_stock'
+        elif stock <= 5:
+            status = "⚠️ Low Stock"
+            product['_status_tag'] = 'low_stock'
+        else:
+            status = "✅ In Stock"
+            product['_status_tag'] = 'in_stock'
+        
+        # Formatted table row values
+        margin = product['_margin']
+        product['_row'] = (
+            product.get('id', ''),
+            product.get('name', ''),
+            product.get('category', ''),
+            f"${buy:.2f}",
+            f"${sell:.2f}",
+            f"{stock:,}",
+            f"${product['_total']:,.2f}",
+            status,
+            f"{margin:.1f}%" if margin is not None else "N/A",
+            product.get('barcode', 'N/A') or 'N/A'
+        )
+    
     # === EVENT HANDLERS ===
     
     def _on_search_change(self, *args):
-        """Handle search input changes"""
+        """Handle search input changes, waiting for typing to pause"""
+        self._schedule_display()
+    
+    def _schedule_display(self):
+        """Redraw the table once the current burst of input has settled"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._apply_search_filter)
+    
+    def _apply_search_filter(self):
+        """Run the debounced search"""
+        self._search_after_id = None
+        self._update_products_display()
+    
+    def _schedule_redraw(self):
+        """Redraw the table at the next idle point, once per burst of filter actions"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        self._redraw_pending = False
+        # A debounced redraw still waiting would only repeat this one
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         self._update_products_display()
     
     def _on_category_change(self, event=None):
         """Handle category filter changes"""
         selected = self.category_var.get()
         self.current_category_filter = "all" if selected == "All Categories" else selected
-        self._update_products_display()
+        # Arrow keys on the combobox fire a selection per step, so debounce
+        self._schedule_display()
     
     def _on_sort_change(self, event=None):
         """Handle sort option changes"""
-        self._update_products_display()
+        self._schedule_display()
     
     def _on_product_select(self, event):
         """Handle product selection in table"""
         selection = self.products_tree.selection()
         if selection:
-            item = self.products_tree.item(selection[0])
-            product_name = item['values'][1] if len(item['values']) > 1 else "Unknown"
+            # Row iids are product IDs, so no Tcl round trip for the values
+            product = self._products_by_id.get(selection[0])
+            product_name = (product.get('name') if product else None) or "Unknown"
             self.selection_info.config(text=f"Selected: {product_name}")
             self.status_text.config(text=f"Selected product: {product_name}")
         else:
@@ -1399,22 +2108,22 @@ class EnhancedInventoryPage(ttk.Frame):
         self.current_category_filter = "all"
         self.category_var.set("All Categories")
         self.search_var.set("")
-        self._update_products_display()
+        self._schedule_redraw()
     
     def _show_low_stock(self):
         """Filter to show only low stock products"""
         self.current_filter = "low_stock"
-        self._update_products_display()
+        self._schedule_redraw()
     
     def _show_out_of_stock(self):
         """Filter to show only out of stock products"""
         self.current_filter = "out_of_stock" 
-        self._update_products_display()
+        self._schedule_redraw()
     
     def _show_high_value(self):
         """Filter to show high value products"""
         self.current_filter = "high_value"
-        self._update_products_display()
+        self._schedule_redraw()
     
     def _filter_by_category(self, category_name):
         """Filter products by category"""
@@ -1423,24 +2132,71 @@ class EnhancedInventoryPage(ttk.Frame):
             self.category_var.set("All Categories")
         else:
             self.category_var.set(category_name)
-        self._update_products_display()
+        self._schedule_redraw()
 
     # === ACTION METHODS ===
     
+    def _submit(self, db_call, on_done, error_text):
+        """Run a database call on the write worker; ``on_done`` gets its result on the Tk thread"""
+        self._set_busy(True)
+        future = _WRITE_EXECUTOR.submit(db_call)
+        future.add_done_callback(lambda f: self.after(0, self._finish_submit, f, on_done, error_text))
+    
+    def _finish_submit(self, future, on_done, error_text):
+        """Hand a finished database call's result to its callback"""
+        self._set_busy(False)
+        try:
+            on_done(future.result())
+        except Exception as e:
+            logger.error("%s: %s", error_text, e)
+            messagebox.showerror("Error", f"{error_text}: {str(e)}", parent=self)
+    
+    def _toast(self, message, indicator="● Saved"):
+        """Report a success in the status bar without a modal dialog"""
+        self.status_text.config(text=message)
+        self.status_indicator.config(text=indicator, fg=self.colors['success'])
+        if self._toast_after_id is not None:
+            self.after_cancel(self._toast_after_id)
+        self._toast_after_id = self.after(TOAST_MS, self._clear_toast)
+    
+    def _clear_toast(self):
+        self._toast_after_id = None
+        self.status_indicator.config(text="● Ready", fg=self.colors['success'])
+    
+    def _set_busy(self, busy):
+        """Disable the action buttons while a database write is running"""
+        state = tk.DISABLED if busy else tk.NORMAL
+        for btn in self._action_buttons:
+            btn.config(state=state)
+        if busy:
+            self.status_indicator.config(text="● Saving...", fg=self.colors['warning'])
+        else:
+            self.status_indicator.config(text="● Ready", fg=self.colors['success'])
+    
     def _add_product(self):
         """Add new product with modern dialog"""
         try:
             dialog = ProductDialog(self)
             result = dialog.show()
             if result:
-                # Add product to database
-                enhanced_data.add_product(result)
-                self._load_data()  # Refresh data
-                self.status_text.config(text="Product added successfully")
+                # Add product to database; the new row's ID comes back on success
+                self._submit(lambda: enhanced_data.add_product(result),
+                             lambda product_id: self._on_product_added(result, product_id,
+                                                                       "Product added successfully"),
+                             "Failed to add product")
         except Exception as e:
-            logger.error(f"Error adding product: {e}")
+            logger.error("Error adding product: %s", e)
             messagebox.showerror("Error", f"Failed to add product: {str(e)}")
     
+    def _on_product_added(self, result, product_id, message):
+        """Show a product saved by add or duplicate"""
+        if not product_id:
+            messagebox.showerror("Error", "Failed to add product to database.")
+            return
+        invalidate_categories_cache()
+        self._apply_local_change(None, dict(result, id=product_id))
+        self._toast(message)
+    
     def _add_category(self):
         """Add new category with modern dialog"""
         try:
@@ -1467,31 +2223,30 @@ class EnhancedInventoryPage(ttk.Frame):
                     return
                 
                 # Add category to database (pass just the name string)
-                success = enhanced_data.add_category(category_name)
-                
-                if success:
-                    # Refresh data to show new category
-                    self._load_data()
-                    
-                    # Show success message
-                    messagebox.showinfo(
-                        "Success", 
-                        f"Category '{category_name}' added successfully!",
-                        parent=self
-                    )
-                    
-                    self.status_indicator.config(text="● Category added", fg=self.colors['success'])
-                else:
-                    messagebox.showerror(
-                        "Error", 
-                        "Failed to add category to database.",
-                        parent=self
-                    )
+                self._submit(lambda: enhanced_data.add_category(category_name),
+                             lambda success: self._on_category_added(category_name, success),
+                             "Failed to add category")
                 
         except Exception as e:
-            logger.error(f"Error adding category: {e}")
+            logger.error("Error adding category: %s", e)
             messagebox.showerror("Error", f"Failed to add category: {str(e)}", parent=self)
     
+    def _on_category_added(self, category_name, success):
+        """Report the outcome of adding a category"""
+        if success:
+            # The page lists categories in use by products, so only the
+            # product dialog's category list needs reloading
+            invalidate_categories_cache()
+            
+            # Show success message
+            self._toast(f"Category '{category_name}' added successfully!", "● Category added")
+        else:
+            messagebox.showerror(
+                "Error", 
+                "Failed to add category to database.",
+                parent=self
+            )
+    
     def _edit_product(self):
         """Edit selected product"""
         selection = self.products_tree.selection()
@@ -1500,11 +2255,8 @@ class EnhancedInventoryPage(ttk.Frame):
             return
         
         try:
-            item = self.products_tree.item(selection[0])
-            product_id = item['values'][0]
-            
-            # Find product data
-            product_data = next((p for p in self.products_data if str(p.get('id')) == str(product_id)), None)
+            # Row iids are product IDs
+            product_data = self._products_by_id.get(selection[0])
             if not product_data:
                 messagebox.showerror("Error", "Product not found")
                 return
@@ -1512,14 +2264,26 @@ class EnhancedInventoryPage(ttk.Frame):
             dialog = ProductDialog(self, product_data)
             result = dialog.show()
             if result:
-                # Update product in database
-                enhanced_data.update_product(product_id, result)
-                self._load_data()  # Refresh data
-                self.status_text.config(text="Product updated successfully")
+                # Update product in database (result carries the product ID)
+                self._submit(lambda: enhanced_data.update_product(result),
+                             lambda ok: self._on_product_updated(selection[0], result, ok),
+                             "Failed to edit product")
         except Exception as e:
-            logger.error(f"Error editing product: {e}")
+            logger.error("Error editing product: %s", e)
             messagebox.showerror("Error", f"Failed to edit product: {str(e)}")
     
+    def _on_product_updated(self, iid, result, ok):
+        """Show a saved product edit"""
+        if not ok:
+            messagebox.showerror("Error", "Failed to update product in database.")
+            return
+        invalidate_categories_cache()
+        # Resolve again: a reload may have replaced the product while the write ran
+        product = self._products_by_id.get(iid)
+        if product is not None:
+            self._apply_local_change(product, result)
+        self._toast("Product updated successfully")
+    
     def _duplicate_product(self):
         """Duplicate selected product"""
         selection = self.products_tree.selection()
@@ -1528,11 +2292,8 @@ class EnhancedInventoryPage(ttk.Frame):
             return
         
         try:
-            item = self.products_tree.item(selection[0])
-            product_id = item['values'][0]
-            
-            # Find product data
-            product_data = next((p for p in self.products_data if str(p.get('id')) == str(product_id)), None)
+            # Row iids are product IDs
+            product_data = self._products_by_id.get(selection[0])
             if not product_data:
                 messagebox.showerror("Error", "Product not found")
                 return
@@ -1546,11 +2307,12 @@ class EnhancedInventoryPage(ttk.Frame):
             result = dialog.show()
             if result:
                 # Add duplicated product to database
-                enhanced_data.add_product(result)
-                self._load_data()  # Refresh data
-                self.status_text.config(text="Product duplicated successfully")
+                self._submit(lambda: enhanced_data.add_product(result),
+                             lambda new_id: self._on_product_added(result, new_id,
+                                                                   "Product duplicated successfully"),
+                             "Failed to duplicate product")
         except Exception as e:
-            logger.error(f"Error duplicating product: {e}")
+            logger.error("Error duplicating product: %s", e)
             messagebox.showerror("Error", f"Failed to duplicate product: {str(e)}")
     
     def _delete_product(self):
@@ -1561,21 +2323,35 @@ class EnhancedInventoryPage(ttk.Frame):
             return
         
         try:
-            item = self.products_tree.item(selection[0])
-            product_name = item['values'][1]
-            product_id = item['values'][0]
+            product = self._products_by_id.get(selection[0])
+            if product is None:
+                messagebox.showerror("Error", "Product not found")
+                return
+            product_name = product.get('name', '')
+            product_id = product.get('id')
             
             # Confirm deletion
             if messagebox.askyesno("Confirm Deletion", 
                                  f"Are you sure you want to delete '{product_name}'?\n\nThis action cannot be undone."):
                 # Delete product from database
-                enhanced_data.delete_product(product_id)
-                self._load_data()  # Refresh data
-                self.status_text.config(text=f"Product '{product_name}' deleted successfully")
+                self._submit(lambda: enhanced_data.delete_product(product_id),
+                             lambda ok: self._on_product_deleted(selection[0], product_name, ok),
+                             "Failed to delete product")
         except Exception as e:
-            logger.error(f"Error deleting product: {e}")
+            logger.error("Error deleting product: %s", e)
             messagebox.showerror("Error", f"Failed to delete product: {str(e)}")
     
+    def _on_product_deleted(self, iid, product_name, ok):
+        """Drop a deleted product from the page"""
+        if not ok:
+            messagebox.showerror("Error", "Failed to delete product from database.")
+            return
+        invalidate_categories_cache()
+        product = self._products_by_id.get(iid)
+        if product is not None:
+            self._apply_local_change(product, None)
+        self._toast(f"Product '{product_name}' deleted successfully")
+    
     def _record_loss(self):
         """Record product loss with modern dialog"""
         selection = self.products_tree.selection()
@@ -1584,31 +2360,76 @@ class EnhancedInventoryPage(ttk.Frame):
             return
         
         try:
-            item = self.products_tree.item(selection[0])
-            product_data = {
-                'id': item['values'][0],
-                'name': item['values'][1],
-                'current_stock': int(item['values'][5].replace(',', ''))
-            }
+            # The loaded product already carries numeric stock and price
+            product_data = self._products_by_id.get(selection[0])
+            if product_data is None:
+                messagebox.showerror("Error", "Product not found")
+                return
             
             dialog = LossRecordDialog(self, product_data)
             result = dialog.show()
             if result:
                 # Record loss in database
-                enhanced_data.record_loss(result)
-                self._load_data()  # Refresh data
-                self.status_text.config(text="Loss recorded successfully")
+                self._submit(lambda: enhanced_data.record_loss(result),
+                             lambda ok: self._on_loss_recorded(selection[0], result['quantity_lost'], ok),
+                             "Failed to record loss")
         except Exception as e:
-            logger.error(f"Error recording loss: {e}")
+            logger.error("Error recording loss: %s", e)
             messagebox.showerror("Error", f"Failed to record loss: {str(e)}")
     
+    def _on_loss_recorded(self, iid, quantity_lost, ok):
+        """Take a recorded loss off the product's stock"""
+        if not ok:
+            messagebox.showerror("Error", "Failed to record loss in database.")
+            return
+        product = self._products_by_id.get(iid)
+        if product is not None:
+            # Mirror the clamp in record_loss so the row matches the database
+            self._apply_local_change(product, {'stock': max(0, product['_stock'] - quantity_lost)})
+        self._toast("Loss recorded successfully")
+    
     def _adjust_stock(self):
         """Adjust stock for selected product"""
         messagebox.showinfo("Stock Adjustment", "Stock adjustment feature coming soon!")
     
     def _bulk_price_update(self):
-        """Update prices for multiple products"""
-        messagebox.showinfo("Bulk Update", "Bulk price update feature coming soon!")
+        """Change the selling price of every selected product by a percentage"""
+        selection = self.products_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select the products to reprice")
+            return
+        
+        from tkinter.simpledialog import askfloat
+        percent = askfloat(
+            "Bulk Price Update",
+            f"Change the selling price of {len(selection)} product(s) by percent (e.g. 10 or -5):",
+            parent=self
+        )
+        if percent is None:
+            return
+        
+        factor = 1 + percent / 100
+        prices = {}
+        for iid in selection:
+            product = self._products_by_id.get(iid)
+            if product is not None:
+                prices[product['id']] = round(max(0.0, product['_sell'] * factor), 2)
+        
+        # All prices are written in one transaction
+        self._submit(lambda: enhanced_data.update_product_prices(prices),
+                     lambda ok: self._on_prices_updated(prices, ok),
+                     "Failed to update prices")
+    
+    def _on_prices_updated(self, prices, ok):
+        """Show the new selling prices of a bulk update"""
+        if not ok:
+            messagebox.showerror("Error", "Failed to update prices in database.")
+            return
+        by_id = self._products_by_id
+        changes = [(by_id[str(product_id)], {'sell_price': price})
+                   for product_id, price in prices.items() if str(product_id) in by_id]
+        self._apply_local_changes(changes)
+        self._toast(f"Updated prices of {len(changes)} products")
     
     def _show_analytics(self):
         """Show detailed analytics"""
@@ -1625,15 +2446,23 @@ class EnhancedInventoryPage(ttk.Frame):
     def _refresh_data(self):
         """Refresh all data"""
         self.status_text.config(text="Refreshing data...")
-        self._load_data()
+        invalidate_categories_cache()
+        self._schedule_load()
+
+    def _register_i18n(self, widget):
+        """Remember a widget so _retranslate can update its text in place"""
+        self._i18n_widgets.append((widget, widget.cget('text')))
+        widget.configure(text=tr(widget.cget('text')))
 
     def _retranslate(self):
-        """Handle language changes"""
-        # Placeholder for internationalization
-        pass
+        """Handle language changes by updating existing widgets in place"""
+        for widget, text in self._i18n_widgets:
+            widget.configure(text=tr(text))
+        for card in self.card_widgets.values():
+            card.itemconfigure(card.title_item, text=tr(card.title_text))
 
     def refresh(self):
         """Refresh the entire page"""
-        self._load_data()
+        self._schedule_load()
 
 # End of EnhancedInventoryPage class
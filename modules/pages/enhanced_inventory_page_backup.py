@@ -20,6 +20,11 @@ from tkinter import (
 )
 import datetime
 import logging
+from array import array
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # Import from our enhanced modules
 from modules.enhanced_data_access import enhanced_data, PagedResult
@@ -33,12 +38,112 @@ from modules.i18n import _, tr, register_refresh_callback, unregister_refresh_ca
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Delay before a search runs, so a burst of keystrokes triggers one query
+SEARCH_DEBOUNCE_MS = 250
+
+# Delay before a category or stock filter change reloads the table, so
+# rapid clicks collapse into one reload
+FILTER_DEBOUNCE_MS = 150
+
+# How long fetched categories and statistics are reused before querying again
+CATEGORIES_CACHE_TTL = 30.0
+STATS_CACHE_TTL = 30.0
+
+# Rows inserted into the products table per page; the next page is added
+# when the user scrolls near the bottom
+PRODUCTS_PAGE_SIZE = 100
+
+# Products table columns with their headings and widths
+COLUMNS = ('id', 'name', 'category', 'buy_price', 'sell_price',
+           'stock', 'total_value', 'status')
+HEADINGS = ('ID', 'Product Name', 'Category', 'Buy Price', 'Sell Price',
+            'Stock', 'Total Value', 'Status')
+WIDTHS = (60, 200, 120, 100, 100, 80, 120, 100)
+
+# Stock status labels shared by every row, and the row tag each one uses
+_STATUS_OK = 'In Stock'
+_STATUS_LOW = 'Low Stock'
+_STATUS_OUT = 'Out of Stock'
+_STATUS_TAGS = {_STATUS_OK: (), _STATUS_LOW: ('low',), _STATUS_OUT: ('out',)}
+
+# Stock filter choices and the stock levels each one keeps
+STOCK_FILTERS = {
+    'all': None,
+    'in_stock': lambda stock: stock > 0,
+    'low_stock': lambda stock: 0 < stock <= 5,
+    'out_of_stock': lambda stock: stock <= 0,
+}
+
+# Sort combo choices and the product value each one orders by; the values
+# are normalised once per fetch and stored on the product under _sort_<column>
+SORT_KEYS = {
+    'name': lambda p: str(p.get('Name', '')).lower(),
+    'price': lambda p: float(p.get('SellingPrice', p.get('Price', 0)) or 0),
+    'stock': lambda p: int(p.get('Stock', 0) or 0),
+    'category': lambda p: str(p.get('Category', '')).lower(),
+}
+SORT_GETTERS = {column: itemgetter('_sort_' + column) for column in SORT_KEYS}
+
+# Runs the products, categories and statistics queries side by side
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="inventory-fetch")
+
+
+# Last fetched product list. After ttl seconds, or once marked stale, it is
+# refetched on the next read but can still be shown while that runs
+_PRODUCTS_CACHE = {'data': None, 'ts': 0.0, 'ttl': 30.0}
+
+
+def _cached_get_products():
+    """Return the cached product list, fetching it again once it is stale"""
+    if (_PRODUCTS_CACHE['data'] is not None
+            and time.monotonic() - _PRODUCTS_CACHE['ts'] < _PRODUCTS_CACHE['ttl']):
+        return _PRODUCTS_CACHE['data']
+    products_list = _fetch_all_products()
+    _PRODUCTS_CACHE['data'] = products_list
+    _PRODUCTS_CACHE['ts'] = time.monotonic()
+    return products_list
+
+
+def _fetch_all_products():
+    """Fetch all products as a plain list prepared for sorting and searching"""
+    products_data = enhanced_data.get_products()
+    
+    # Handle both list and PagedResult formats
+    if hasattr(products_data, 'data'):
+        # It's a PagedResult object
+        products_list = products_data.data
+    elif isinstance(products_data, list):
+        # It's a plain list
+        products_list = products_data
+    else:
+        return []
+    
+    for product in products_list:
+        for column, key in SORT_KEYS.items():
+            product['_sort_' + column] = key(product)
+        # Lower-cased name, category and barcode searched by the filter
+        product['_search_text'] = '\n'.join((
+            str(product.get('Name') or ''),
+            str(product.get('Category') or ''),
+            str(product.get('Barcode') or ''))).lower()
+    return products_list
+
+
 class EnhancedInventoryPage(ttk.Frame):
     """
     Professional business-focused inventory management system with category organization,
     detailed product management, and critical loss recording for financial accuracy.
     """
     
+    # ttk styles are global, so they only need configuring once per process
+    _styles_configured = False
+    
+    # Categories change rarely, so share one fetch across clicks and instances
+    _categories_cache = None
+    _categories_cache_ts = 0.0
+    _stats_cache = None
+    _stats_cache_ts = 0.0
+    
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
@@ -59,7 +164,7 @@ class EnhancedInventoryPage(ttk.Frame):
         }
         
         # Business data variables
-        self.current_category = "All Categories"
+        self.current_category = "All"
         self.current_search = ""
         self.selected_product = None
         self.products_data = []
@@ -69,7 +174,36 @@ class EnhancedInventoryPage(ttk.Frame):
         
         # UI Variables
         self.search_var = StringVar()
-        self.search_var.trace('w', self._on_search_change)
+        self.stock_filter_var = StringVar(value="all")
+        self._search_after_id = None
+        
+        # Translated UI strings, rebuilt when the language changes, and the
+        # (widget, source text) pairs that display them
+        self._tr_cache = {}
+        self._translatable_labels = []
+        
+        # Filtered products not yet inserted into the table start here
+        self._rows_shown = 0
+        
+        # Table rows by product id as (iid, values), kept across filter, sort
+        # and data changes so rows are moved, detached or patched, not rebuilt
+        self._tree_items = {}
+        self._rows_source = None
+        self._cols = {'category': [], 'stock': array('l'), 'search': []}
+        
+        # Bumped for every background load; results from an older load are
+        # dropped instead of overwriting newer ones
+        self._load_seq = 0
+        
+        # Pending debounced products table reload
+        self._refresh_after = None
+        
+        # Pending after_idle job while a refresh cycle is in progress
+        self._refresh_cycle_id = None
+        
+        # Category buttons are pooled and reconfigured on every reload
+        self._cat_btn_pool = []
+        self._cat_btn_names = []
         
         # Statistics variables
         self.stats = {
@@ -90,40 +224,46 @@ class EnhancedInventoryPage(ttk.Frame):
     
     def _setup_professional_styles(self):
         """Setup professional business styles"""
+        if EnhancedInventoryPage._styles_configured:
+            return
         style = ttk.Style()
+        colors = self.colors
+        background, card, primary, text = (
+            colors['background'], colors['card'], colors['primary'], colors['text'])
+        success, warning, danger = colors['success'], colors['warning'], colors['danger']
         
         # Professional business frame styles
         style.configure("Business.TFrame", 
-                       background=self.colors['background'])
+                       background=background)
         
         style.configure("BusinessCard.TFrame", 
-                       background=self.colors['card'],
+                       background=card,
                        relief="solid", 
                        borderwidth=1)
         
         style.configure("BusinessSidebar.TFrame",
-                       background=self.colors['primary'])
+                       background=primary)
         
         # Professional typography
         style.configure("BusinessTitle.TLabel",
                        font=("Segoe UI", 20, "bold"),
-                       foreground=self.colors['primary'],
-                       background=self.colors['background'])
+                       foreground=primary,
+                       background=background)
         
         style.configure("BusinessHeader.TLabel",
                        font=("Segoe UI", 14, "bold"),
-                       foreground=self.colors['text'],
-                       background=self.colors['card'])
+                       foreground=text,
+                       background=card)
         
         style.configure("BusinessText.TLabel",
                        font=("Segoe UI", 10),
-                       foreground=self.colors['text'],
-                       background=self.colors['card'])
+                       foreground=text,
+                       background=card)
         
         style.configure("SidebarText.TLabel",
                        font=("Segoe UI", 11, "bold"),
                        foreground='white',
-                       background=self.colors['primary'])
+                       background=primary)
         
         # Professional button styles
         style.configure("Category.TButton",
@@ -135,19 +275,21 @@ class EnhancedInventoryPage(ttk.Frame):
         
         # Status indicator styles
         style.configure("Success.TLabel",
-                       foreground=self.colors['success'],
-                       background=self.colors['card'],
+                       foreground=success,
+                       background=card,
                        font=("Segoe UI", 9, "bold"))
         
         style.configure("Warning.TLabel", 
-                       foreground=self.colors['warning'],
-                       background=self.colors['card'],
+                       foreground=warning,
+                       background=card,
                        font=("Segoe UI", 9, "bold"))
         
         style.configure("Danger.TLabel",
-                       foreground=self.colors['danger'], 
-                       background=self.colors['card'],
+                       foreground=danger, 
+                       background=card,
                        font=("Segoe UI", 9, "bold"))
+        
+        EnhancedInventoryPage._styles_configured = True
 
     def _create_professional_ui(self):
         """Create professional business-focused UI layout"""
@@ -162,9 +304,8 @@ class EnhancedInventoryPage(ttk.Frame):
         title_frame = ttk.Frame(main_container, style="Business.TFrame")
         title_frame.pack(fill=X, pady=(0, 15))
         
-        title_label = ttk.Label(title_frame, 
-                               text="📦 Professional Inventory Management",
-                               style="BusinessTitle.TLabel")
+        title_label = self._translated(ttk.Label, title_frame, "📦 Professional Inventory Management",
+                                       style="BusinessTitle.TLabel")
         title_label.pack(side=LEFT)
         
         # Professional layout: Sidebar + Main content
@@ -188,9 +329,8 @@ class EnhancedInventoryPage(ttk.Frame):
         sidebar_content.pack(fill=BOTH, expand=True, padx=15, pady=15)
         
         # Categories section
-        categories_title = ttk.Label(sidebar_content,
-                                   text="📁 Product Categories",
-                                   style="SidebarText.TLabel")
+        categories_title = self._translated(ttk.Label, sidebar_content, "📁 Product Categories",
+                                            style="SidebarText.TLabel")
         categories_title.pack(anchor=W, pady=(0, 10))
         
         # Categories container
@@ -198,9 +338,8 @@ class EnhancedInventoryPage(ttk.Frame):
         self.categories_frame.pack(fill=X, pady=(0, 20))
         
         # Statistics section  
-        stats_title = ttk.Label(sidebar_content,
-                               text="📊 Quick Statistics",
-                               style="SidebarText.TLabel")
+        stats_title = self._translated(ttk.Label, sidebar_content, "📊 Quick Statistics",
+                                       style="SidebarText.TLabel")
         stats_title.pack(anchor=W, pady=(20, 10))
         
         # Statistics container
@@ -246,9 +385,8 @@ class EnhancedInventoryPage(ttk.Frame):
         search_frame = ttk.Frame(controls_frame, style="BusinessCard.TFrame")
         search_frame.pack(side=LEFT, fill=X, expand=True)
         
-        search_label = ttk.Label(search_frame, 
-                                text="🔍 Search Products:",
-                                style="BusinessHeader.TLabel")
+        search_label = self._translated(ttk.Label, search_frame, "🔍 Search Products:",
+                                        style="BusinessHeader.TLabel")
         search_label.pack(side=LEFT, padx=(0, 10))
         
         self.search_entry = ttk.Entry(search_frame, 
@@ -256,14 +394,14 @@ class EnhancedInventoryPage(ttk.Frame):
                                      font=("Segoe UI", 11),
                                      width=30)
         self.search_entry.pack(side=LEFT, padx=(0, 10))
+        self.search_entry.bind('<KeyRelease>', self._on_search_change)
         
         # Sort controls
         sort_frame = ttk.Frame(controls_frame, style="BusinessCard.TFrame")
         sort_frame.pack(side=RIGHT)
         
-        ttk.Label(sort_frame, 
-                 text="Sort by:",
-                 style="BusinessText.TLabel").pack(side=LEFT, padx=(10, 5))
+        self._translated(ttk.Label, sort_frame, "Sort by:",
+                         style="BusinessText.TLabel").pack(side=LEFT, padx=(10, 5))
         
         self.sort_combo = ttk.Combobox(sort_frame,
                                       values=['Name', 'Price', 'Stock', 'Category'],
@@ -282,9 +420,8 @@ class EnhancedInventoryPage(ttk.Frame):
         header_frame = ttk.Frame(table_frame, style="BusinessCard.TFrame")
         header_frame.pack(fill=X, pady=(0, 10))
         
-        ttk.Label(header_frame,
-                 text="📋 Product Details",
-                 style="BusinessHeader.TLabel").pack(side=LEFT)
+        self._translated(ttk.Label, header_frame, "📋 Product Details",
+                         style="BusinessHeader.TLabel").pack(side=LEFT)
         
         self.results_label = ttk.Label(header_frame,
                                       text="",
@@ -292,37 +429,29 @@ class EnhancedInventoryPage(ttk.Frame):
         self.results_label.pack(side=RIGHT)
         
         # Professional treeview with detailed columns
-        columns = ('id', 'name', 'category', 'buy_price', 'sell_price', 
-                  'stock', 'total_value', 'status')
-        
         self.products_tree = ttk.Treeview(table_frame,
-                                         columns=columns,
+                                         columns=COLUMNS,
                                          show='headings',
                                          height=15)
         
-        # Configure column headings and widths
-        column_config = {
-            'id': ('ID', 60),
-            'name': ('Product Name', 200),
-            'category': ('Category', 120),
-            'buy_price': ('Buy Price', 100),
-            'sell_price': ('Sell Price', 100),
-            'stock': ('Stock', 80),
-            'total_value': ('Total Value', 120),
-            'status': ('Status', 100)
-        }
-        
-        for col, (heading, width) in column_config.items():
+        # Configure column headings and widths; headings are centred by
+        # default, cells are not
+        for col, heading, width in zip(COLUMNS, HEADINGS, WIDTHS):
             self.products_tree.heading(col, text=heading)
             self.products_tree.column(col, width=width, anchor=CENTER)
         
+        # Stock level colours, applied through the row tags
+        self.products_tree.tag_configure('low', foreground=self.colors['warning'])
+        self.products_tree.tag_configure('out', foreground=self.colors['danger'])
+        
         # Scrollbars
         v_scrollbar = ttk.Scrollbar(table_frame, orient=VERTICAL, 
                                    command=self.products_tree.yview)
         h_scrollbar = ttk.Scrollbar(table_frame, orient=HORIZONTAL,
                                    command=self.products_tree.xview)
+        self._tree_vscroll = v_scrollbar
         
-        self.products_tree.configure(yscrollcommand=v_scrollbar.set,
+        self.products_tree.configure(yscrollcommand=self._on_tree_scroll,
                                     xscrollcommand=h_scrollbar.set)
         
         # Grid layout for table and scrollbars
@@ -335,6 +464,7 @@ class EnhancedInventoryPage(ttk.Frame):
         
         # Bind selection event
         self.products_tree.bind('<<TreeviewSelect>>', self._on_product_select)
+        self.products_tree.bind('<Double-1>', self._edit_product)
     
     def _create_action_buttons(self, parent):
         """Create professional action buttons"""
@@ -345,497 +475,155 @@ class EnhancedInventoryPage(ttk.Frame):
         left_buttons = ttk.Frame(actions_frame, style="BusinessCard.TFrame")
         left_buttons.pack(side=LEFT)
         
-        ttk.Button(left_buttons,
-                  text="➕ Add Product",
-                  bootstyle="success",
-                  command=self._show_add_product_dialog).pack(side=LEFT, padx=(0, 10))
+        self._translated(ttk.Button, left_buttons, "➕ Add Product",
+                         bootstyle="success",
+                         command=self._add_product).pack(side=LEFT, padx=(0, 10))
         
-        ttk.Button(left_buttons,
-                  text="✏️ Edit Product", 
-                  bootstyle="primary",
-                  command=self._edit_selected_product).pack(side=LEFT, padx=(0, 10))
+        # Selection-dependent buttons stay disabled until a row is selected
+        self.edit_btn = self._translated(ttk.Button, left_buttons, "✏️ Edit Product",
+                                         bootstyle="primary",
+                                         command=self._edit_product,
+                                         state="disabled")
+        self.edit_btn.pack(side=LEFT, padx=(0, 10))
         
-        ttk.Button(left_buttons,
-                  text="🗑️ Delete",
-                  bootstyle="danger",
-                  command=self._delete_selected_product).pack(side=LEFT, padx=(0, 10))
+        self.delete_btn = self._translated(ttk.Button, left_buttons, "🗑️ Delete",
+                                           bootstyle="danger",
+                                           command=self._delete_product,
+                                           state="disabled")
+        self.delete_btn.pack(side=LEFT, padx=(0, 10))
         
         # Right side buttons - Critical Business Functions
         right_buttons = ttk.Frame(actions_frame, style="BusinessCard.TFrame")
         right_buttons.pack(side=RIGHT)
         
-        ttk.Button(right_buttons,
-                  text="📉 Record Loss",
-                  bootstyle="warning",
-                  command=self._record_loss).pack(side=LEFT, padx=(0, 10))
-        
-        ttk.Button(right_buttons,
-                  text="📊 Export Report",
-                  bootstyle="info", 
-                  command=self._export_report).pack(side=LEFT)
-                       padding=(15, 8),
-                       background="#0078D4",
-                       foreground="#FFFFFF")
-        
-        # Statistics card styles
-        style.configure("Stats.TLabel", 
-                       font=("Segoe UI", 14, "bold"), 
-                       foreground="#FFFFFF",
-                       background="#2B2B2B")
-        
-        # Product list styles - dark theme
-        style.configure("Product.Treeview", 
-                       font=("Segoe UI", 10),
-                       background="#383838",
-                       foreground="#FFFFFF",
-                       fieldbackground="#383838",
-                       rowheight=25)
-        
-        style.configure("Product.Treeview.Heading", 
-                       font=("Segoe UI", 10, "bold"),
-                       background="#2B2B2B",
-                       foreground="#FFFFFF")
-        
-        # Search entry dark theme
-        style.configure("Search.TEntry", 
-                       font=("Segoe UI", 12),
-                       fieldbackground="#383838",
-                       foreground="#FFFFFF",
-                       borderwidth=1)
-    
-    def _create_ui(self):
-        """Create the main UI layout"""
-        # Main container with dark background to match system theme
-        main_container = ttk.Frame(self, style="Dark.TFrame")
-        main_container.pack(fill=BOTH, expand=True, padx=10, pady=10)
-        
-        # Header section
-        self._create_header(main_container)
-        
-        # Statistics dashboard
-        self._create_statistics(main_container)
-        
-        # Categories section
-        self._create_categories_section(main_container)
-        
-        # Search and filters
-        self._create_search_section(main_container)
-        
-        # Products list and management
-        self._create_products_section(main_container)
-        
-        # Action buttons
-        self._create_action_buttons(main_container)
-    
-    def _create_header(self, parent):
-        """Create header with title and navigation"""
-        header_frame = ttk.Frame(parent, style="Dark.TFrame")
-        header_frame.pack(fill=X, pady=(0, 20))
-        
-        # Title with dark theme
-        title_label = ttk.Label(
-            header_frame,
-            text=_("📦 Inventory Management"),
-            style="DarkHeader.TLabel"
-        )
-        title_label.pack(side=LEFT)
-        
-        # Back button
-        back_btn = ttk.Button(
-            header_frame,
-            text=_("🏠 Back to Home"),
-            bootstyle="secondary-outline",
-            command=lambda: self.controller.show_frame("MainMenuPage")
-        )
-        back_btn.pack(side=RIGHT)
-        
-        # Refresh button
-        refresh_btn = ttk.Button(
-            header_frame,
-            text=_("🔄 Refresh"),
-            bootstyle="info-outline",
-            command=self._refresh_all_data
-        )
-        refresh_btn.pack(side=RIGHT, padx=(0, 10))
-    
-    def _create_statistics(self, parent):
-        """Create statistics dashboard with dark theme"""
-        stats_frame = ttk.Frame(parent, style="Dark.TFrame")
-        stats_frame.pack(fill=X, pady=(0, 20))
-        
-        # Title with dark theme
-        ttk.Label(
-            stats_frame,
-            text=_("📊 Inventory Statistics"),
-            style="DarkSubheader.TLabel"
-        ).pack(anchor=W, pady=(0, 10))
-        
-        # Stats cards container
-        cards_frame = ttk.Frame(stats_frame, style="Dark.TFrame")
-        cards_frame.pack(fill=X)
-        
-        # Total Products Card
-        self.total_products_card = ttk.Frame(cards_frame, style="DarkCard.TFrame")
-        self.total_products_card.pack(side=LEFT, fill=X, expand=True, padx=(0, 10))
-        
-        ttk.Label(
-            self.total_products_card,
-            text="📦",
-            font=("Segoe UI", 24),
-            background="#383838",
-            foreground="#FFFFFF"
-        ).pack(pady=(10, 5))
-        
-        ttk.Label(
-            self.total_products_card,
-            text=_("Total Products"),
-            font=("Segoe UI", 10, "bold"),
-            foreground="#FFFFFF",
-            background="#383838"
-        ).pack()
-        
-        self.total_products_label = ttk.Label(
-            self.total_products_card,
-            text="0",
-            font=("Segoe UI", 20, "bold"),
-            foreground="#FFFFFF",
-            background="#383838"
-        )
-        self.total_products_label.pack(pady=(5, 10))
-        
-        # Total Value Card with dark theme
-        self.total_value_card = ttk.Frame(cards_frame, style="DarkCard.TFrame")
-        self.total_value_card.pack(side=LEFT, fill=X, expand=True, padx=(5, 5))
-        
-        ttk.Label(
-            self.total_value_card,
-            text="💰",
-            font=("Segoe UI", 24),
-            background="#383838",
-            foreground="#FFFFFF"
-        ).pack(pady=(10, 5))
-        
-        ttk.Label(
-            self.total_value_card,
-            text=_("Total Value"),
-            font=("Segoe UI", 10, "bold"),
-            foreground="#6C757D",
-            background="#F8F9FA"
-        ).pack()
-        
-        self.total_value_label = ttk.Label(
-            self.total_value_card,
-            text="$0.00",
-            font=("Segoe UI", 20, "bold"),
-            foreground="#28A745",
-            background="#F8F9FA"
-        )
-        self.total_value_label.pack(pady=(5, 10))
-        
-        # Low Stock Card
-        self.low_stock_card = ttk.Frame(cards_frame, style="Card.TFrame")
-        self.low_stock_card.pack(side=LEFT, fill=X, expand=True, padx=(5, 0))
-        
-        ttk.Label(
-            self.low_stock_card,
-            text="⚠️",
-            font=("Segoe UI", 24),
-            background="#F8F9FA"
-        ).pack(pady=(10, 5))
-        
-        ttk.Label(
-            self.low_stock_card,
-            text=_("Low Stock Items"),
-            font=("Segoe UI", 10, "bold"),
-            foreground="#6C757D",
-            background="#F8F9FA"
-        ).pack()
-        
-        self.low_stock_label = ttk.Label(
-            self.low_stock_card,
-            text="0",
-            font=("Segoe UI", 20, "bold"),
-            foreground="#DC3545",
-            background="#F8F9FA"
-        )
-        self.low_stock_label.pack(pady=(5, 10))
-    
-    def _create_categories_section(self, parent):
-        """Create categories management section"""
-        categories_frame = ttk.Frame(parent, style="Light.TFrame")
-        categories_frame.pack(fill=X, pady=(0, 20))
-        
-        # Header
-        header_frame = ttk.Frame(categories_frame, style="Light.TFrame")
-        header_frame.pack(fill=X, pady=(0, 10))
-        
-        ttk.Label(
-            header_frame,
-            text=_("📁 Categories"),
-            style="Subheader.TLabel"
-        ).pack(side=LEFT)
-        
-        # Add category button
-        add_cat_btn = ttk.Button(
-            header_frame,
-            text=_("➕ Add Category"),
-            bootstyle="success-outline",
-            command=self._add_category
-        )
-        add_cat_btn.pack(side=RIGHT)
-        
-        # Categories buttons container
-        self.categories_container = ttk.Frame(categories_frame, style="Light.TFrame")
-        self.categories_container.pack(fill=X)
+        self.loss_btn = self._translated(ttk.Button, right_buttons, "📉 Record Loss",
+                                         bootstyle="warning",
+                                         command=self._record_loss,
+                                         state="disabled")
+        self.loss_btn.pack(side=LEFT, padx=(0, 10))
         
-        # Load categories buttons
-        self._load_categories()
+        self._translated(ttk.Button, right_buttons, "📊 Export Report",
+                         bootstyle="info",
+                         command=self._export_products).pack(side=LEFT)
     
     def _load_categories(self):
         """Load and display category buttons"""
-        # Clear existing buttons
-        for widget in self.categories_container.winfo_children():
-            widget.destroy()
-        
         try:
-            # Load categories from database
-            categories = enhanced_data.get_categories()
+            categories = self._get_categories()
+            category_list = getattr(categories, 'data', categories) or []
             
-            # Add "All" category first
-            all_btn = ttk.Button(
-                self.categories_container,
-                text=_("📋 All Categories"),
-                style="ActiveCategory.TButton" if self.current_category == "All" else "Category.TButton",
-                bootstyle="primary" if self.current_category == "All" else "outline-primary",
-                command=lambda: self._filter_by_category("All")
-            )
-            all_btn.pack(side=LEFT, padx=(0, 5), pady=5)
+            # "All" category first, then one button per category
+            names = ["All"]
+            texts = [self._translate("📋 All Categories")]
+            for category in category_list:
+                cat_name = category.get('name', category.get('Name', 'Unknown'))
+                names.append(cat_name)
+                texts.append(f"📂 {cat_name}")
+            self._cat_btn_names = names
             
-            # Add category buttons
-            if hasattr(categories, 'data'):
-                for category in categories.data:
-                    cat_name = category.get('Name', 'Unknown')
-                    cat_btn = ttk.Button(
-                        self.categories_container,
-                        text=f"📂 {cat_name}",
-                        style="ActiveCategory.TButton" if self.current_category == cat_name else "Category.TButton",
-                        bootstyle="primary" if self.current_category == cat_name else "outline-primary",
-                        command=lambda c=cat_name: self._filter_by_category(c)
+            # Reconfigure pooled buttons instead of destroying and recreating
+            # them; each button keeps one command that reads its slot's name
+            pool = self._cat_btn_pool
+            for index, text in enumerate(texts):
+                active = self.current_category == names[index]
+                style = "ActiveCategory.TButton" if active else "Category.TButton"
+                bootstyle = "primary" if active else "outline-primary"
+                if index < len(pool):
+                    btn = pool[index]
+                    btn.configure(text=text, style=style, bootstyle=bootstyle)
+                else:
+                    btn = ttk.Button(
+                        self.categories_frame,
+                        text=text,
+                        style=style,
+                        bootstyle=bootstyle,
+                        command=lambda i=index: self._filter_by_category(self._cat_btn_names[i])
                     )
-                    cat_btn.pack(side=LEFT, padx=5, pady=5)
+                    pool.append(btn)
+                if not btn.winfo_manager():
+                    btn.pack(fill=X, pady=2)
+            
+            # Hide surplus buttons left over from a longer category list
+            for btn in pool[len(texts):]:
+                btn.pack_forget()
             
         except Exception as e:
             logger.error(f"Error loading categories: {e}")
     
-    def _create_search_section(self, parent):
-        """Create search and filter section"""
-        search_frame = ttk.Frame(parent, style="Light.TFrame")
-        search_frame.pack(fill=X, pady=(0, 20))
-        
-        # Search row
-        search_row = ttk.Frame(search_frame, style="Light.TFrame")
-        search_row.pack(fill=X, pady=(0, 10))
-        
-        ttk.Label(
-            search_row,
-            text=_("🔍 Search:"),
-            style="Body.TLabel"
-        ).pack(side=LEFT, padx=(0, 10))
-        
-        # Search entry
-        self.search_entry = ttk.Entry(
-            search_row,
-            textvariable=self.search_var,
-            font=("Segoe UI", 12),
-            width=40
-        )
-        self.search_entry.pack(side=LEFT, padx=(0, 10))
-        self.search_entry.bind('<KeyRelease>', self._on_search_change)
-        
-        # Search button
-        search_btn = ttk.Button(
-            search_row,
-            text=_("Search"),
-            bootstyle="primary",
-            command=self._perform_search
-        )
-        search_btn.pack(side=LEFT, padx=(0, 10))
-        
-        # Clear button
-        clear_btn = ttk.Button(
-            search_row,
-            text=_("Clear"),
-            bootstyle="secondary-outline",
-            command=self._clear_search
-        )
-        clear_btn.pack(side=LEFT)
-        
-        # Filter row
-        filter_row = ttk.Frame(search_frame, style="Light.TFrame")
-        filter_row.pack(fill=X)
-        
-        ttk.Label(
-            filter_row,
-            text=_("Filter:"),
-            style="Body.TLabel"
-        ).pack(side=LEFT, padx=(0, 10))
-        
-        # Stock status filters
-        ttk.Radiobutton(
-            filter_row,
-            text=_("All Items"),
-            variable=self.stock_filter_var,
-            value="all",
-            command=self._apply_filters
-        ).pack(side=LEFT, padx=(0, 15))
-        
-        ttk.Radiobutton(
-            filter_row,
-            text=_("In Stock"),
-            variable=self.stock_filter_var,
-            value="in_stock",
-            command=self._apply_filters
-        ).pack(side=LEFT, padx=(0, 15))
-        
-        ttk.Radiobutton(
-            filter_row,
-            text=_("Low Stock"),
-            variable=self.stock_filter_var,
-            value="low_stock",
-            command=self._apply_filters
-        ).pack(side=LEFT, padx=(0, 15))
-        
-        ttk.Radiobutton(
-            filter_row,
-            text=_("Out of Stock"),
-            variable=self.stock_filter_var,
-            value="out_of_stock",
-            command=self._apply_filters
-        ).pack(side=LEFT)
-    
-    def _create_products_section(self, parent):
-        """Create products list and management section"""
-        products_frame = ttk.Frame(parent, style="Light.TFrame")
-        products_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
-        
-        # Header
-        header_frame = ttk.Frame(products_frame, style="Light.TFrame")
-        header_frame.pack(fill=X, pady=(0, 10))
-        
-        ttk.Label(
-            header_frame,
-            text=_("📋 Products List"),
-            style="Subheader.TLabel"
-        ).pack(side=LEFT)
-        
-        # Status label
-        self.status_label = ttk.Label(
-            header_frame,
-            text="",
-            style="Body.TLabel"
-        )
-        self.status_label.pack(side=RIGHT)
-        
-        # Products treeview with scrollbars
-        tree_frame = ttk.Frame(products_frame, style="Light.TFrame")
-        tree_frame.pack(fill=BOTH, expand=True)
-        
-        # Define columns
-        columns = ("ID", "Name", "Category", "Stock", "Price", "Buy_Price", "Barcode")
-        
-        self.products_tree = ttk.Treeview(
-            tree_frame,
-            columns=columns,
-            show="headings",
-            style="Product.Treeview",
-            height=15
-        )
-        
-        # Configure columns
-        self.products_tree.heading("ID", text=_("ID"))
-        self.products_tree.heading("Name", text=_("Product Name"))
-        self.products_tree.heading("Category", text=_("Category"))
-        self.products_tree.heading("Stock", text=_("Stock"))
-        self.products_tree.heading("Price", text=_("Sell Price"))
-        self.products_tree.heading("Buy_Price", text=_("Buy Price"))
-        self.products_tree.heading("Barcode", text=_("Barcode"))
-        
-        # Configure column widths
-        self.products_tree.column("ID", width=50, minwidth=50)
-        self.products_tree.column("Name", width=200, minwidth=150)
-        self.products_tree.column("Category", width=120, minwidth=100)
-        self.products_tree.column("Stock", width=80, minwidth=60)
-        self.products_tree.column("Price", width=100, minwidth=80)
-        self.products_tree.column("Buy_Price", width=100, minwidth=80)
-        self.products_tree.column("Barcode", width=120, minwidth=100)
-        
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=VERTICAL, command=self.products_tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient=HORIZONTAL, command=self.products_tree.xview)
-        
-        self.products_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack treeview and scrollbars
-        self.products_tree.pack(side=LEFT, fill=BOTH, expand=True)
-        v_scrollbar.pack(side=RIGHT, fill=Y)
-        h_scrollbar.pack(side=BOTTOM, fill=X)
-        
-        # Bind selection event
-        self.products_tree.bind('<<TreeviewSelect>>', self._on_product_select)
-        self.products_tree.bind('<Double-1>', self._edit_product)
+    @classmethod
+    def _get_categories(cls):
+        """Return categories, reusing the last fetch while it is fresh"""
+        now = time.monotonic()
+        if (cls._categories_cache is None
+                or now - cls._categories_cache_ts >= CATEGORIES_CACHE_TTL):
+            cls._categories_cache = enhanced_data.get_categories()
+            cls._categories_cache_ts = now
+        return cls._categories_cache
     
-    def _create_action_buttons(self, parent):
-        """Create action buttons for product management"""
-        actions_frame = ttk.Frame(parent, style="Light.TFrame")
-        actions_frame.pack(fill=X)
-        
-        # Add Product button
-        add_btn = ttk.Button(
-            actions_frame,
-            text=_("➕ Add Product"),
-            bootstyle="success",
-            command=self._add_product
-        )
-        add_btn.pack(side=LEFT, padx=(0, 10))
-        
-        # Edit Product button
-        self.edit_btn = ttk.Button(
-            actions_frame,
-            text=_("✏️ Edit Product"),
-            bootstyle="warning",
-            command=self._edit_product,
-            state="disabled"
-        )
-        self.edit_btn.pack(side=LEFT, padx=(0, 10))
-        
-        # Delete Product button
-        self.delete_btn = ttk.Button(
-            actions_frame,
-            text=_("🗑️ Delete Product"),
-            bootstyle="danger",
-            command=self._delete_product,
-            state="disabled"
-        )
-        self.delete_btn.pack(side=LEFT, padx=(0, 10))
-        
-        # Record Loss button
-        self.loss_btn = ttk.Button(
-            actions_frame,
-            text=_("📉 Record Loss"),
-            bootstyle="warning-outline",
-            command=self._record_loss,
-            state="disabled"
-        )
-        self.loss_btn.pack(side=LEFT, padx=(0, 10))
-        
-        # Export button
-        export_btn = ttk.Button(
-            actions_frame,
-            text=_("📤 Export"),
-            bootstyle="info-outline",
-            command=self._export_products
+    @classmethod
+    def _invalidate_categories(cls):
+        """Drop cached categories after a category change"""
+        cls._categories_cache = None
+    
+    @classmethod
+    def _get_inventory_stats(cls):
+        """Return inventory statistics, reusing the last query while it is fresh"""
+        now = time.monotonic()
+        if cls._stats_cache is None or now - cls._stats_cache_ts >= STATS_CACHE_TTL:
+            stats = enhanced_data.get_inventory_stats()
+            if stats is None:
+                # Don't cache a failed query; keep the last good statistics, if any
+                return cls._stats_cache
+            cls._stats_cache = stats
+            cls._stats_cache_ts = now
+        return cls._stats_cache
+    
+    @classmethod
+    def _invalidate_stats(cls):
+        """Drop cached statistics after products change"""
+        cls._stats_cache = None
+    
+    @staticmethod
+    def _fetch_products():
+        """Fetch all products as a plain list"""
+        # Category, search and stock filters are applied in Python, so every
+        # view shares the one cached product list
+        return _cached_get_products()
+    
+    def _load_business_data(self):
+        """Load page data on a background thread so the page opens immediately"""
+        self._load_seq += 1
+        threading.Thread(target=self._bg_load, args=(self._load_seq,), daemon=True).start()
+    
+    def _bg_load(self, seq):
+        """Fetch products, categories and statistics in parallel off the Tk thread"""
+        futures = (
+            _FETCH_EXECUTOR.submit(self._fetch_products),
+            _FETCH_EXECUTOR.submit(self._get_categories),
+            _FETCH_EXECUTOR.submit(self._get_inventory_stats),
         )
-        export_btn.pack(side=RIGHT)
+        try:
+            # Categories and statistics land in their class caches, which
+            # _apply_loaded_data reads back on the Tk thread
+            for future in futures:
+                future.result()
+                if seq != self._load_seq:
+                    # A newer load started; drop whatever is still queued
+                    for pending in futures:
+                        pending.cancel()
+                    return
+        except Exception as e:
+            logger.error(f"Error loading inventory data: {e}")
+            return
+        self.after(0, self._apply_loaded_data, futures[0].result(), seq)
+    
+    def _apply_loaded_data(self, products_list, seq):
+        """Display data fetched by _bg_load; runs on the Tk thread"""
+        if seq != self._load_seq:
+            return
+        self._load_categories()
+        self._load_statistics()
+        self._show_products(products_list)
     
     def _load_initial_data(self):
         """Load initial data for the page"""
@@ -845,127 +633,218 @@ class EnhancedInventoryPage(ttk.Frame):
     def _load_statistics(self):
         """Load and display inventory statistics"""
         try:
-            # Get products data
-            products_data = enhanced_data.get_products()
-            
-            # Handle both list and PagedResult formats
-            if hasattr(products_data, 'data'):
-                # It's a PagedResult object
-                products_list = products_data.data
-            elif isinstance(products_data, list):
-                # It's a plain list
-                products_list = products_data
-            else:
-                products_list = []
-            
-            if products_list:
-                total_products = len(products_list)
-                total_value = sum(float(p.get('SellingPrice', p.get('Price', 0))) * int(p.get('Stock', 0)) for p in products_list)
-                low_stock = sum(1 for p in products_list if int(p.get('Stock', 0)) <= 5 and int(p.get('Stock', 0)) > 0)
-                
-                self.total_products_label.config(text=str(total_products))
-                self.total_value_label.config(text=f"${total_value:.2f}")
-                self.low_stock_label.config(text=str(low_stock))
-            
+            stats = self._get_inventory_stats()
+            if stats is not None:
+                self.stats.update(stats)
+            self._update_statistics()
         except Exception as e:
             logger.error(f"Error loading statistics: {e}")
     
+    def _update_statistics(self):
+        """Show the current statistics in the sidebar"""
+        stats = self.stats
+        labels = self.stats_labels
+        labels['total_products'].config(text=f"Products: {stats['total_products']}")
+        labels['total_categories'].config(text=f"Categories: {stats['total_categories']}")
+        labels['low_stock'].config(text=f"Low Stock: {stats['low_stock']}")
+        labels['out_of_stock'].config(text=f"Out of Stock: {stats['out_of_stock']}")
+        labels['total_value'].config(text=f"Total Value: ${stats['total_value']:.2f}")
+    
     def _load_products(self):
-        """Load and display products"""
+        """Display products from the cache, refetching them in the background once stale"""
+        # Never query on the Tk thread: only _bg_load goes through
+        # _cached_get_products, and its result is diffed in when it lands
+        products_list = _PRODUCTS_CACHE['data']
         try:
-            # Clear existing items
-            for item in self.products_tree.get_children():
-                self.products_tree.delete(item)
-            
-            # Load products
-            products_data = enhanced_data.get_products()
-            
-            # Handle both list and PagedResult formats
-            if hasattr(products_data, 'data'):
-                # It's a PagedResult object
-                products_list = products_data.data
-            elif isinstance(products_data, list):
-                # It's a plain list
-                products_list = products_data
-            else:
-                products_list = []
+            if products_list is not None:
+                self._show_products(products_list)
+        except Exception as e:
+            logger.error(f"Error loading products: {e}")
+            messagebox.showerror(_("Error"), f"{_('Error loading products')}: {e}")
+        if (products_list is None
+                or time.monotonic() - _PRODUCTS_CACHE['ts'] >= _PRODUCTS_CACHE['ttl']):
+            self._load_business_data()
+    
+    def _show_products(self, products_list):
+        """Filter an already fetched product list and display it"""
+        try:
+            if products_list is not self._rows_source:
+                self._diff_rows(products_list)
+                self._rows_source = products_list
+                self._build_columns(products_list)
             
-            for product in products_list:
-                # Apply current filters
-                if not self._should_show_product(product):
-                    continue
-                
-                values = (
-                    product.get('ProductID', product.get('ID', '')),
-                    product.get('Name', ''),
-                    product.get('Category', ''),
-                    product.get('Stock', ''),
-                    f"${float(product.get('SellingPrice', product.get('Price', 0))):.2f}",
-                    f"${float(product.get('BuyingPrice', product.get('BuyPrice', 0))):.2f}",
-                    product.get('Barcode', '')
-                )
-                
-                # Color coding for stock levels
-                item_id = self.products_tree.insert('', 'end', values=values)
-                stock = int(product.get('Stock', 0))
-                if stock == 0:
-                    self.products_tree.set(item_id, "Stock", "Out of Stock")
-                elif stock <= 5:
-                    # Low stock - could add tag here for coloring
-                    pass
+            # Apply current filters; rows are built and inserted a page at
+            # a time as the table is scrolled
+            self.products_data = [products_list[i] for i in self._filtered_indices()]
+            self._sort_products()
+            self._render_rows()
             
-            self.status_label.config(text=f"{len(self.products_tree.get_children())} products displayed")
+            self.results_label.config(text=f"{len(self.products_data)} products displayed")
             
         except Exception as e:
             logger.error(f"Error loading products: {e}")
             messagebox.showerror(_("Error"), f"{_('Error loading products')}: {e}")
     
-    def _should_show_product(self, product):
-        """Check if product should be shown based on current filters"""
+    def _diff_rows(self, products_list):
+        """Bring existing rows in line with newly fetched products"""
+        tree = self.products_tree
+        items = self._tree_items
+        product_id = self._product_id
+        by_id = {product_id(p): p for p in products_list}
+        
+        # Delete rows for products that no longer exist
+        gone = [pid for pid in items if pid not in by_id]
+        if gone:
+            tree.delete(*[items.pop(pid)[0] for pid in gone])
+        
+        # Patch only the rows whose values changed; rows for new products
+        # are inserted when their page is placed
+        for values in self._compute_derived([by_id[pid] for pid in items]):
+            iid, old_values = items[values[0]]
+            if values != old_values:
+                tree.item(iid, values=values, tags=_STATUS_TAGS[values[7]])
+                items[values[0]] = (iid, values)
+    
+    def _sort_products(self):
+        """Order the filtered products by the selected sort column"""
+        self.products_data.sort(key=SORT_GETTERS[self.sort_column], reverse=self.sort_reverse)
+    
+    def _render_rows(self):
+        """Show the first page of products_data, hiding rows no longer shown"""
+        self._rows_shown = 0
+        self._insert_next_page()
+        tree = self.products_tree
+        tree.detach(*tree.get_children()[self._rows_shown:])
+    
+    @staticmethod
+    def _product_id(product):
+        """Return the id a product is keyed by in the table"""
+        return product.get('ProductID', product.get('ID', product.get('id', '')))
+    
+    def _insert_next_page(self):
+        """Place the next page of filtered products in the table"""
+        start = self._rows_shown
+        page = self.products_data[start:start + PRODUCTS_PAGE_SIZE]
+        if not page:
+            return
+        
+        # Only products without a row yet need their values formatted
+        items = self._tree_items
+        product_id = self._product_id
+        new_rows = iter(self._compute_derived(
+            [p for p in page if product_id(p) not in items]))
+        
+        tree = self.products_tree
+        # Hide the columns while inserting so the page is laid out once
+        tree.configure(displaycolumns=())
+        try:
+            for index, product in enumerate(page, start):
+                pid = product_id(product)
+                item = items.get(pid)
+                if item is None:
+                    values = next(new_rows)
+                    items[pid] = (tree.insert('', index, values=values,
+                                              tags=_STATUS_TAGS[values[7]]), values)
+                else:
+                    # move() also reattaches rows hidden by an earlier filter
+                    tree.move(item[0], '', index)
+        finally:
+            tree.configure(displaycolumns='#all')
+        self._rows_shown = start + len(page)
+        self.update_idletasks()
+    
+    def _on_tree_scroll(self, first, last):
+        """Update the scrollbar and load more rows near the bottom"""
+        self._tree_vscroll.set(first, last)
+        if float(last) >= 0.9 and self._rows_shown < len(self.products_data):
+            self.after_idle(self._insert_next_page)
+    
+    def _compute_derived(self, products):
+        """Build table rows, deriving total value and stock status per product"""
+        # One pass per product; rows follow the table columns: id, name,
+        # category, buy_price, sell_price, stock, total_value, status
+        rows = []
+        append = rows.append
+        for product in products:
+            get = product.get
+            # Sell price and stock were normalised once at fetch time
+            sell_price = product['_sort_price']
+            stock = product['_sort_stock']
+            buy_price = float(get('BuyingPrice') or get('BuyPrice') or 0)
+            append((
+                get('ProductID', get('ID', get('id', ''))),
+                get('Name', ''),
+                get('Category', ''),
+                f"${buy_price:.2f}",
+                f"${sell_price:.2f}",
+                stock,
+                f"${buy_price * stock:.2f}",
+                _STATUS_OUT if stock <= 0 else _STATUS_LOW if stock <= 5 else _STATUS_OK
+            ))
+        return rows
+    
+    def _build_columns(self, products_list):
+        """Store the filtered-on fields of each product as parallel columns"""
+        self._cols = {
+            'category': [p.get('Category', '') for p in products_list],
+            'stock': array('l', [p['_sort_stock'] for p in products_list]),
+            'search': [p['_search_text'] for p in products_list],
+        }
+    
+    def _filtered_indices(self):
+        """Return the positions of products matching the current filters"""
+        cols = self._cols
+        # Each filter only scans the positions that passed the previous one
+        indices = range(len(cols['stock']))
+        
         # Category filter
-        if self.current_category != "All" and product.get('Category', '') != self.current_category:
-            return False
+        category = self.current_category
+        if category != "All":
+            indices = [i for i, c in enumerate(cols['category']) if c == category]
         
         # Stock filter
-        stock = int(product.get('Stock', 0))
-        stock_filter = self.stock_filter_var.get()
-        
-        if stock_filter == "in_stock" and stock <= 0:
-            return False
-        elif stock_filter == "out_of_stock" and stock > 0:
-            return False
-        elif stock_filter == "low_stock" and (stock > 5 or stock <= 0):
-            return False
+        keep = STOCK_FILTERS.get(self.stock_filter_var.get())
+        if keep is not None:
+            stocks = cols['stock']
+            indices = [i for i in indices if keep(stocks[i])]
         
         # Search filter
-        if self.current_search:
-            search_text = self.current_search.lower()
-            if (search_text not in product.get('Name', '').lower() and
-                search_text not in product.get('Category', '').lower() and
-                search_text not in product.get('Barcode', '').lower()):
-                return False
+        search_text = self.current_search.lower()
+        if search_text:
+            texts = cols['search']
+            indices = [i for i in indices if search_text in texts[i]]
         
-        return True
+        return indices
+    
+    def _on_sort_change(self, event=None):
+        """Reorder the existing table rows for the selected sort column"""
+        self.sort_column = self.sort_combo.get().lower()
+        self._sort_products()
+        self._render_rows()
     
     def _filter_by_category(self, category):
         """Filter products by category"""
         self.current_category = category
         self._load_categories()  # Refresh category buttons
-        self._load_products()    # Refresh products list
+        self._schedule_products_reload()
     
-    def _on_search_change(self, event):
+    def _on_search_change(self, event=None):
         """Handle search text change with debouncing"""
-        # Cancel previous search
-        if hasattr(self, '_search_after'):
-            self.after_cancel(self._search_after)
+        # Cancel the pending search so only the last keystroke queries
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
         
         # Schedule new search
-        self._search_after = self.after(500, self._perform_search)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._perform_search)
     
     def _perform_search(self):
         """Perform the search"""
-        self.current_search = self.search_var.get().strip()
-        self._load_products()
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self.current_search = self.search_entry.get().strip()
+        # Typing was already debounced; just coalesce with pending filter reloads
+        self._schedule_products_reload(0)
     
     def _perform_product_search(self, search_term: str, limit: int = None):
         """Perform product search with limit parameter"""
@@ -985,10 +864,21 @@ class EnhancedInventoryPage(ttk.Frame):
         self.current_category = "All"
         self.stock_filter_var.set("all")
         self._load_categories()
-        self._load_products()
+        self._schedule_products_reload()
     
     def _apply_filters(self):
         """Apply current filters"""
+        self._schedule_products_reload()
+    
+    def _schedule_products_reload(self, delay=FILTER_DEBOUNCE_MS):
+        """Reload the products table once filter changes settle"""
+        if self._refresh_after is not None:
+            self.after_cancel(self._refresh_after)
+        self._refresh_after = self.after(delay, self._run_products_reload)
+    
+    def _run_products_reload(self):
+        """Run the reload scheduled by _schedule_products_reload"""
+        self._refresh_after = None
         self._load_products()
     
     def _on_product_select(self, event):
@@ -1060,14 +950,17 @@ class EnhancedInventoryPage(ttk.Frame):
         
         initial_data = None
         if edit_mode and self.selected_product:
+            product_id = self.selected_product[0]
+            barcode = next((p.get('Barcode', '') for p in self.products_data
+                            if str(p.get('ProductID', p.get('ID', ''))) == str(product_id)), '')
             initial_data = {
-                'ID': self.selected_product[0],
+                'ID': product_id,
                 'Name': self.selected_product[1],
                 'Category': self.selected_product[2],
-                'Stock': self.selected_product[3],
+                'Stock': self.selected_product[5],
                 'Price': self.selected_product[4].replace('$', ''),
-                'BuyPrice': self.selected_product[5].replace('$', ''),
-                'Barcode': self.selected_product[6]
+                'BuyPrice': self.selected_product[3].replace('$', ''),
+                'Barcode': barcode
             }
         
         dialog = ProductDialog(self, edit_mode=edit_mode, initial_data=initial_data)
@@ -1081,7 +974,7 @@ class EnhancedInventoryPage(ttk.Frame):
         product_data = {
             'ID': self.selected_product[0],
             'Name': self.selected_product[1],
-            'Current_Stock': self.selected_product[3]
+            'Current_Stock': self.selected_product[5]
         }
         
         dialog = LossDialog(self, product_data)
@@ -1094,14 +987,33 @@ class EnhancedInventoryPage(ttk.Frame):
         
         dialog = CategoryDialog(self)
         if dialog.result:
+            self._invalidate_categories()
             self._load_categories()
     
     def _refresh_all_data(self):
         """Refresh all data"""
-        self._load_statistics()
-        self._load_categories()
-        self._load_products()
+        self._invalidate_categories()
+        self._invalidate_stats()
+        _PRODUCTS_CACHE['ts'] = 0.0  # Stale, but still shown until refetched
         invalidate_cache()  # Clear cache to ensure fresh data
+        self._revalidate()
+    
+    def _revalidate(self):
+        """Show cached products at once and bring them up to date in the background"""
+        # show_frame() calls prepare_for_display() and then refresh(), which
+        # both land here in the same event-loop turn; only the first loads
+        if self._refresh_cycle_id is not None:
+            return
+        self._refresh_cycle_id = self.after_idle(self._end_refresh_cycle)
+        
+        if _PRODUCTS_CACHE['data'] is not None:
+            self._show_products(_PRODUCTS_CACHE['data'])
+        # Only refetches what is stale; a newer list is diffed into the table
+        self._load_business_data()
+    
+    def _end_refresh_cycle(self):
+        """Allow the next refresh to fetch again"""
+        self._refresh_cycle_id = None
     
     def refresh_data(self):
         """Public method to refresh data - called from external components"""
@@ -1111,18 +1023,40 @@ class EnhancedInventoryPage(ttk.Frame):
         """Public method to load data - called from external components"""
         self._refresh_all_data()
     
+    def _translate(self, text):
+        """Translate text, reusing the lookup until the language changes"""
+        try:
+            return self._tr_cache[text]
+        except KeyError:
+            translated = self._tr_cache[text] = _(text)
+            return translated
+    
+    def _translated(self, widget_class, parent, key, **options):
+        """Create a widget showing translated text and track it for retranslation"""
+        widget = widget_class(parent, text=self._translate(key), **options)
+        self._translatable_labels.append((widget, key))
+        return widget
+    
     def _retranslate(self):
         """Update text for language changes"""
-        # This will be called when language changes
-        pass
+        self._tr_cache.clear()
+        
+        # Only touch widgets whose text actually changed, so Tk does not
+        # re-measure labels that read the same in the new language
+        for widget, key in self._translatable_labels:
+            text = self._translate(key)
+            if widget.cget('text') != text:
+                widget.configure(text=text)
+        
+        self._load_categories()
     
     def refresh(self):
         """Called when page is shown"""
-        self._refresh_all_data()
+        self._revalidate()
     
     def prepare_for_display(self):
         """Called before page is displayed"""
-        self._refresh_all_data()
+        self._revalidate()
     
     def __del__(self):
         """Cleanup when page is destroyed"""
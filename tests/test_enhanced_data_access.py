@@ -0,0 +1,179 @@
+"""
+Tests for the EnhancedDataAccess write paths against a temporary SQLite database
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modules.db_manager as db_manager
+from modules.db_manager import ConnectionPool
+from modules.enhanced_data_access import EnhancedDataAccess
+from database import init_db
+
+
+@pytest.fixture
+def data(tmp_path, monkeypatch):
+    """EnhancedDataAccess backed by a fresh database with the app's schema"""
+    pool = ConnectionPool(str(tmp_path / 'test.db'), pool_size=2)
+    monkeypatch.setattr(db_manager, '_connection_pool', pool)
+
+    conn = pool.get_connection()
+    cursor = conn.cursor()
+    init_db._create_products_table(cursor)
+    init_db._create_losses_table(cursor)
+    init_db._create_invoices_table(cursor)
+    init_db._create_debits_table(cursor)
+    # Databases upgraded from older releases carry AmountPaid, which the
+    # debit queries read and mark_debit_as_paid writes
+    cursor.execute("ALTER TABLE Debits ADD COLUMN AmountPaid REAL DEFAULT 0")
+    conn.commit()
+    pool.return_connection(conn)
+
+    yield EnhancedDataAccess()
+    pool.close_all()
+
+
+def _execute(sql, params=()):
+    with db_manager.ConnectionContext() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def _add_product(name, stock, price=1.0):
+    with db_manager.ConnectionContext() as conn:
+        cursor = conn.execute(
+            "INSERT INTO Products (Name, Stock, SellingPrice, Category) VALUES (?, ?, ?, ?)",
+            (name, stock, price, 'General'))
+        return cursor.lastrowid
+
+
+def test_record_loss_inserts_row_and_decrements_stock(data):
+    product_id = _add_product('Milk', 10)
+
+    assert data.record_loss({'product_id': product_id, 'quantity_lost': 3,
+                             'reason': 'Damaged', 'notes': 'dropped'})
+
+    rows = _execute("SELECT ProductID, Quantity, Reason FROM Losses")
+    assert [tuple(r) for r in rows] == [(product_id, 3, 'Damaged - dropped')]
+    stock = _execute("SELECT Stock FROM Products WHERE ProductID = ?", (product_id,))[0][0]
+    assert stock == 7
+
+
+def test_record_loss_clamps_stock_at_zero(data):
+    product_id = _add_product('Bread', 2)
+
+    assert data.record_loss({'product_id': product_id, 'quantity_lost': 5,
+                             'reason': 'Expired'})
+
+    stock = _execute("SELECT Stock FROM Products WHERE ProductID = ?", (product_id,))[0][0]
+    assert stock == 0
+    assert _execute("SELECT Quantity FROM Losses")[0][0] == 5
+
+
+def test_inventory_stats_aggregate(data):
+    # Low stock is 1..threshold, out of stock is zero or below
+    _add_product('Out', 0, price=4.0)
+    _add_product('Low', 5, price=2.0)
+    _add_product('Edge', 6, price=1.5)
+    _add_product('Plenty', 20, price=0.5)
+    with db_manager.ConnectionContext() as conn:
+        conn.execute("UPDATE Products SET Category = 'Dairy' WHERE Name = 'Low'")
+
+    stats = data.get_inventory_stats(low_stock_threshold=5)
+
+    assert stats == {
+        'total_products': 4,
+        'total_categories': 2,
+        'total_value': pytest.approx(5 * 2.0 + 6 * 1.5 + 20 * 0.5),
+        'low_stock': 1,
+        'out_of_stock': 1,
+    }
+
+
+def test_inventory_stats_returns_none_on_error(data):
+    with db_manager.ConnectionContext() as conn:
+        conn.execute("DROP TABLE Losses")
+        conn.execute("DROP TABLE Products")
+
+    assert data.get_inventory_stats() is None
+
+
+def _run_background(method, *args):
+    """Call a callback-style data access method and wait for its result"""
+    done = threading.Event()
+    results = []
+
+    def finish(result):
+        results.append(result)
+        done.set()
+
+    assert method(*args, on_success=finish, on_error=finish)
+    assert done.wait(5)
+    return results[0]
+
+
+def _add_debit(name, amount):
+    with db_manager.ConnectionContext() as conn:
+        cursor = conn.execute(
+            "INSERT INTO Debits (Name, Amount, Status, Notes) VALUES (?, ?, 'Pending', '')",
+            (name, amount))
+        return cursor.lastrowid
+
+
+def test_update_product_prices_single_batch(data):
+    ids = [_add_product(f'Item {i}', 1, price=1.0) for i in range(5)]
+    prices = {product_id: 2.5 + product_id for product_id in ids}
+
+    statements = []
+    for conn in list(db_manager._connection_pool.connections.queue):
+        conn.set_trace_callback(statements.append)
+
+    assert data.update_product_prices(prices)
+
+    rows = _execute("SELECT ProductID, SellingPrice FROM Products")
+    assert {row[0]: row[1] for row in rows} == prices
+    updates = [sql for sql in statements if sql.startswith('UPDATE Products')]
+    assert len(updates) == len(ids)
+    assert [sql for sql in statements if sql == 'COMMIT'] == ['COMMIT']
+
+
+def test_update_debit_returns_saved_row(data):
+    debit_id = _add_debit('Sam', 40.0)
+
+    result = _run_background(data.update_debit, {
+        'DebitID': debit_id, 'CustomerName': 'Sam Lee', 'Amount': 55.0,
+        'Notes': 'called', 'Paid': False,
+    })
+
+    assert result['success']
+    # The page merges this into the displayed debit instead of reloading
+    assert result['row'] == {
+        'CustomerName': 'Sam Lee', 'Name': 'Sam Lee', 'Amount': 55.0,
+        'Status': 'Pending', 'Paid': False, 'Notes': 'called',
+    }
+    row = _execute("SELECT Name, Amount, Status, Notes FROM Debits WHERE DebitID = ?", (debit_id,))[0]
+    assert tuple(row) == ('Sam Lee', 55.0, 'Pending', 'called')
+
+
+def test_mark_debit_as_paid_returns_saved_row(data):
+    debit_id = _add_debit('Ana', 12.5)
+
+    result = _run_background(data.mark_debit_as_paid, debit_id)
+
+    assert result['success']
+    assert result['row'] == {'AmountPaid': 12.5, 'Status': 'Paid', 'Paid': True}
+    row = _execute("SELECT Status, AmountPaid FROM Debits WHERE DebitID = ?", (debit_id,))[0]
+    assert tuple(row) == ('Paid', 12.5)
+
+
+def test_update_debit_reports_missing_debit(data):
+    result = _run_background(data.update_debit, {'DebitID': 999, 'CustomerName': 'Nobody',
+                                                 'Amount': 1.0})
+
+    assert not result['success']
+    assert 'row' not in result